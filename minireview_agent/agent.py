@@ -3,41 +3,62 @@ import os
 from dotenv import load_dotenv
 from google.adk.agents import LlmAgent
 from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
-from google.adk.tools.mcp_tool.mcp_toolset import McpToolset
-from mcp import StdioServerParameters
+
+from .toolset import SERVER_PARAMS, LazyMcpToolset
 
 load_dotenv()
 
-root_agent = LlmAgent(
-    model=os.getenv("GEMINI_MODEL", "gemini-2.5-flash"),
-    name="MiniReview",
-    instruction=(
-        "You are a mobile game expert. You can help users find games, get details "
-        "about them, and much more. You are using the MiniReview API to get the "
-        "information.\n\n"
-        "IMPORTANT: When a user asks for games with certain criteria (e.g., "
-        "category, tags, monetization), you MUST follow this workflow:\n"
-        "1. First, call `get_category_options`, `get_tag_options`, or other "
-        "specific filter-retrieving tools (or `get_all_filters` as a fallback) to "
-        "get the available filter options. DO NOT assume or guess the filter "
-        "values.\n"
-        "2. Analyze the user's request and map their criteria to the exact values "
-        "retrieved from the filter tools.\n"
-        "3. Finally, call the `get_games_list` tool, using the validated filter "
-        "options from step 2 to provide the user with the requested game list."
-    ),
-    tools=[
-        McpToolset(
-            connection_params=StdioConnectionParams(
-                server_params=StdioServerParameters(
-                    command="python",
-                    args=[
-                        "-m",
-                        "server",
-                    ],
+# Built on first access, so importing the module doesn't start the MCP server.
+_root_agent: LlmAgent | None = None
+
+
+def _build_root_agent() -> LlmAgent:
+    return LlmAgent(
+        model=os.getenv("GEMINI_MODEL", "gemini-2.5-flash"),
+        name="MiniReview",
+        instruction=(
+            "You are a mobile game expert. You can help users find games, get details "
+            "about them, and much more. You are using the MiniReview API to get the "
+            "information.\n\n"
+            "IMPORTANT: When a user asks for games with certain criteria (e.g., "
+            "category, tags, monetization), you MUST follow this workflow:\n"
+            "1. First, call `get_category_options`, `get_tag_options`, or other "
+            "specific filter-retrieving tools (or `get_all_filters` as a fallback) to "
+            "get the available filter options. DO NOT assume or guess the filter "
+            "values.\n"
+            "2. Analyze the user's request and map their criteria to the exact values "
+            "retrieved from the filter tools.\n"
+            "3. Finally, call the `get_games_list` tool, using the validated filter "
+            "options from step 2 to provide the user with the requested game list."
+        ),
+        tools=[
+            # The toolset's session manager pools the stdio session, so `server` is
+            # spawned once, on the first tool call, and reused afterwards.
+            LazyMcpToolset(
+                connection_params=StdioConnectionParams(
+                    server_params=SERVER_PARAMS,
+                    timeout=30,
+                ),
+                # Only used when the tools manifest is missing and the tool list has
+                # to be fetched from the server.
+                tool_list_cache_ttl_seconds=float(
+                    os.getenv("MCP_TOOL_LIST_CACHE_TTL", "300")
                 ),
-                timeout=30,
-            ),
-        )
-    ],
-)
+            )
+        ],
+    )
+
+
+def get_root_agent() -> LlmAgent:
+    """Returns the shared agent, building it on first use."""
+    global _root_agent
+    if _root_agent is None:
+        _root_agent = _build_root_agent()
+    return _root_agent
+
+
+def __getattr__(name: str):
+    # ADK looks up `root_agent` on this module; build it lazily (PEP 562).
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,96 @@
+"""
+This module contains the LazyMcpToolset class, which exposes the MCP server's
+tools to the agent without spawning the server until a tool is actually called.
+
+The tool specs are read from a pre-generated manifest. Regenerate it after
+changing the tools in `server.py` with:
+
+    python -m minireview_agent.toolset
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from google.adk.tools.mcp_tool.mcp_toolset import McpToolset
+from mcp import StdioServerParameters, Tool
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _loads = json.loads
+
+MANIFEST_PATH = Path(__file__).with_name("tools_manifest.json")
+
+# Spawn the server with the agent's own interpreter, which skips the PATH lookup
+# and guarantees the same environment, from the project root, so `-m server`
+# resolves wherever the agent is started from.
+SERVER_PARAMS = StdioServerParameters(
+    command=sys.executable,
+    args=[
+        "-m",
+        "server",
+    ],
+    cwd=str(Path(__file__).resolve().parent.parent),
+)
+
+
+class LazyMcpToolset(McpToolset):
+    """An McpToolset that lists its tools from a manifest instead of the server."""
+
+    def __init__(self, *, manifest_path: Path = MANIFEST_PATH, **kwargs):
+        super().__init__(**kwargs)
+        self._manifest_path = manifest_path
+        self._manifest_tools: list[Tool] | None = None
+
+    def _load_manifest(self) -> list[Tool] | None:
+        """Loads and caches the tool specs, or returns None if there is none."""
+        if self._manifest_tools is None and self._manifest_path.exists():
+            self._manifest_tools = [
+                Tool.model_validate(t) for t in _loads(self._manifest_path.read_bytes())
+            ]
+        return self._manifest_tools
+
+    def _read_tool_list_cache(self, cache_key: str | None) -> list[Tool] | None:
+        """
+        Serves the tool specs from the manifest, so `McpToolset.get_tools` builds
+        the tools (filtering, confirmation, headers and all) without listing them
+        from the server. The session manager only spawns the server when one of
+        the tools is run, so turns answered without tools never pay the
+        subprocess cost.
+        """
+        manifest_tools = self._load_manifest()
+        if manifest_tools is not None:
+            return manifest_tools
+        return super()._read_tool_list_cache(cache_key)
+
+
+async def dump_manifest(manifest_path: Path = MANIFEST_PATH):
+    """
+    Writes the server's tool specs to the manifest. The tools are listed
+    in-process, so no server subprocess is needed.
+    """
+    from fastmcp import Client
+
+    from server import app
+
+    async with Client(app) as client:
+        server_tools = await client.list_tools()
+
+    tools = sorted(
+        (
+            t.model_dump(mode="json", by_alias=True, exclude_none=True)
+            for t in server_tools
+        ),
+        key=lambda t: t["name"],
+    )
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(tools, f, indent=2)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(dump_manifest())
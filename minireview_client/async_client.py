@@ -0,0 +1,153 @@
+"""
+This module contains the AsyncMiniReviewClient class, an asyncio variant of the
+MiniReviewClient for callers that fetch several endpoints at once.
+"""
+
+import asyncio
+import functools
+from collections.abc import Iterable, Sequence
+
+from .client import _DEFAULT_PLATFORMS, MiniReviewClient
+from .enums import Platform
+
+
+def _awaitable(method, load_filters: bool = False):
+    """
+    Wraps a MiniReviewClient method whose result comes from `_fetch_api` so it
+    can be awaited. With `load_filters`, the filters the method validates its
+    params against are loaded first, without blocking the event loop.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if load_filters:
+            await self.get_filters()
+        return await method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncMiniReviewClient(MiniReviewClient):
+    """
+    An asyncio client for the minireview.io API (v2).
+
+    It has the same methods as MiniReviewClient, but they are coroutines, so
+    several can run concurrently with `asyncio.gather`:
+
+        async with AsyncMiniReviewClient() as client:
+            home, games = await asyncio.gather(
+                client.get_home(), client.get_games_list(limit=10)
+            )
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Concurrent calls that all need the filters fetch them only once.
+        self._filters_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+        self.close()
+
+    async def aclose(self):
+        """Closes the async connection pool, if it was opened."""
+        await self._aclose()
+
+    async def _fetch_api(self, endpoint: str, params: dict | None = None) -> dict:
+        return await self._afetch_api(endpoint, params)
+
+    def _init_validator(self):
+        # The methods that validate load the filters before they run, so there is
+        # nothing left to (synchronously) fetch here.
+        assert self._parsed_filters is not None
+
+    async def get_filters(self) -> dict:
+        """The async counterpart of `MiniReviewClient.get_filters`."""
+        filters = self._get_cached_filters()
+        if filters is not None:
+            return filters
+
+        async with self._filters_lock:
+            filters = self._get_cached_filters()
+            if filters is not None:
+                return filters
+            params = self._build_params({"limit": 1})
+            return self._store_filters(await self._fetch_api("/games", params))
+
+    async def _get_filter_options(self, filter_slug: str) -> dict:
+        await self.get_filters()
+        return dict(self._filter_index.get(filter_slug, {}))
+
+    async def get_games_list_pages(self, pages: Iterable[int], **filters) -> list[dict]:
+        """
+        Fetches several pages of `get_games_list` concurrently, at most
+        `MAX_CONCURRENT_REQUESTS` at a time.
+
+        Returns:
+            The responses, in the same order as `pages`.
+        """
+        return await self._agather(
+            self.get_games_list(page=page, **filters) for page in pages
+        )
+
+    async def get_games_details(self, games: Iterable[tuple[str, str]]) -> list[dict]:
+        """
+        Fetches the details of several games concurrently, at most
+        `MAX_CONCURRENT_REQUESTS` at a time. The API has no batch endpoint, so
+        the requests share the connection pool instead.
+
+        Args:
+            games: `(game_slug, category)` pairs.
+
+        Returns:
+            The details responses, in the same order as `games`.
+        """
+        return await self._agather(
+            self.get_game_details(game_slug, category) for game_slug, category in games
+        )
+
+    async def get_game_bundle(
+        self,
+        game_slug: str,
+        category: str,
+        game_id: int,
+        limit: int = 50,
+        platforms: Sequence[Platform] = _DEFAULT_PLATFORMS,
+    ) -> dict:
+        """
+        Fetches a game's details, its newest ratings and its similar games
+        concurrently. The params are validated against the filters, which this
+        client can load without blocking.
+
+        Returns:
+            A dictionary with the raw `details`, `ratings` and `similar` responses.
+        """
+        details, ratings, similar = await asyncio.gather(
+            self.get_game_details(game_slug, category),
+            self.get_game_ratings(game_id, limit=limit),
+            self.get_similar_games(game_id, limit=limit, platforms=platforms),
+        )
+        return {"details": details, "ratings": ratings, "similar": similar}
+
+    get_game_details = _awaitable(MiniReviewClient.get_game_details)
+    get_games_list = _awaitable(MiniReviewClient.get_games_list, load_filters=True)
+    get_game_ratings = _awaitable(MiniReviewClient.get_game_ratings, load_filters=True)
+    get_similar_games = _awaitable(
+        MiniReviewClient.get_similar_games, load_filters=True
+    )
+    get_home = _awaitable(MiniReviewClient.get_home, load_filters=True)
+    get_games_of_the_week = _awaitable(
+        MiniReviewClient.get_games_of_the_week, load_filters=True
+    )
+    get_minireview_pick = _awaitable(
+        MiniReviewClient.get_minireview_pick, load_filters=True
+    )
+    get_top_user_ratings = _awaitable(
+        MiniReviewClient.get_top_user_ratings, load_filters=True
+    )
+    get_upcoming_games = _awaitable(
+        MiniReviewClient.get_upcoming_games, load_filters=True
+    )
@@ -3,10 +3,25 @@ This module contains the MiniReviewClient class, which is the main entry point
 for interacting with the minireview.io API.
 """
 
+import asyncio
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
 
 from .enums import (
     GameRatingsOrderBy,
@@ -17,19 +32,323 @@ from .enums import (
     Players,
     ScreenOrientation,
     TopUserRatingsOrderBy,
+    UpComingGamesOrderBy,
 )
 from .exceptions import APIError
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _loads = json.loads
+
+# Query-string values of every enum member, so building params is a dict lookup
+# per value instead of an isinstance check plus `.value` access.
+_ENUM_VALUES: dict[type[Enum], dict[Enum, str]] = {
+    enum_cls: {member: str(member.value) for member in enum_cls}
+    for enum_cls in (
+        GameRatingsOrderBy,
+        GameRatingType,
+        GamesListOrderBy,
+        Monetization,
+        Platform,
+        Players,
+        ScreenOrientation,
+        TopUserRatingsOrderBy,
+        UpComingGamesOrderBy,
+    )
+}
+
+
+def _coerce(value: Any) -> Any:
+    """Returns the query-string value of an enum member, or the value itself."""
+    values = _ENUM_VALUES.get(type(value))
+    if values is not None:
+        return values[value]
+    return value.value if isinstance(value, Enum) else value
+
+
+def _coerce_str(value: Any) -> str:
+    """Like `_coerce`, but always returns a string."""
+    values = _ENUM_VALUES.get(type(value))
+    if values is not None:
+        return values[value]
+    return str(value.value if isinstance(value, Enum) else value)
+
+
+# The default platforms of the client's methods. A tuple, so it can be shared as
+# a default argument, and pre-encoded, since most calls use it.
+_DEFAULT_PLATFORMS = (Platform.ANDROID, Platform.IOS)
+_DEFAULT_PLATFORMS_PARAMS = {
+    f"platforms[{i}]": _coerce(p) for i, p in enumerate(_DEFAULT_PLATFORMS)
+}
+
+
+def _to_enum(enum_cls: type[Enum], value: Any, name: str) -> Enum:
+    """
+    Returns `value` as a member of `enum_cls`, also accepting the member's string
+    value (e.g. from JSON callers). Raises a TypeError for anything else.
+    """
+    try:
+        # The client's enums are StrEnums, so members hash like their values.
+        member = enum_cls._value2member_map_.get(value)
+    except TypeError:  # Unhashable
+        member = None
+    if member is None:
+        raise TypeError(f"{name} must be a member of the {enum_cls.__name__} enum")
+    return member
+
+
+def _to_platforms(platforms: Sequence[Any]) -> Sequence[Platform]:
+    """Returns `platforms` as Platform members, like `_to_enum`."""
+    if platforms is _DEFAULT_PLATFORMS:
+        return platforms
+    lookup = Platform._value2member_map_
+    try:
+        return [lookup[p] for p in platforms]
+    except (KeyError, TypeError):
+        raise TypeError(
+            "All items in platforms must be members of the Platform enum"
+        ) from None
+
+
+def _encode_auto(params: dict[str, Any], key: str, value: Any):
+    """Encodes a parameter of unknown shape based on its type."""
+    encoder = _ENCODERS_BY_TYPE.get(type(value))
+    if encoder is not None:
+        encoder(params, key, value)
+    # Subclasses and enums defined outside the client
+    elif isinstance(value, Enum):
+        params[key] = _coerce(value)
+    elif isinstance(value, list):
+        _encode_csv(params, key, value)
+    elif isinstance(value, dict):
+        _encode_indexed_dict(params, key, value)
+    else:
+        params[key] = value
+
+
+def _encode_plain(params: dict[str, Any], key: str, value: Any):
+    """Encodes a value as-is."""
+    params[key] = value
+
+
+def _encode_bool(params: dict[str, Any], key: str, value: bool):
+    """Encodes a boolean as 1 or 0."""
+    params[key] = 1 if value else 0
+
+
+def _encode_indexed_dict(params: dict[str, Any], key: str, value: dict):
+    """Encodes a dictionary as indexed keys, e.g. `key[name]`."""
+    for s, v in value.items():
+        params[f"{key}[{s}]"] = v
+
+
+def _encode_scalar(params: dict[str, Any], key: str, value: Any):
+    """Encodes an enum member or a plain value."""
+    params[key] = _coerce(value)
+
+
+def _encode_csv(params: dict[str, Any], key: str, value: Any):
+    """Encodes a list as comma-separated values, and a single value as-is."""
+    if not isinstance(value, (list, tuple)):
+        params[key] = _coerce(value)
+        return
+    # A list comprehension: str.join builds a list from a generator anyway.
+    params[key] = ",".join([_coerce_str(v) for v in value])
+
+
+def _encode_indexed_list(params: dict[str, Any], key: str, value: Sequence):
+    """Encodes a list as indexed keys, e.g. `platforms[0]`."""
+    if value is _DEFAULT_PLATFORMS:
+        params.update(_DEFAULT_PLATFORMS_PARAMS)
+        return
+    for i, v in enumerate(value):
+        params[f"{key}[{i}]"] = _coerce(v)
+
+
+def _encode_score(params: dict[str, Any], key: str, value: dict):
+    """Encodes the score filter as comma-separated `name-value` pairs."""
+    params[key] = ",".join([f"{s}-{v}" for s, v in value.items()])
+
+
+# Encoders for parameters of unknown shape, by exact type, so the common cases
+# take a single dict lookup instead of a chain of isinstance checks.
+_ENCODERS_BY_TYPE = {
+    int: _encode_plain,
+    float: _encode_plain,
+    str: _encode_plain,
+    bool: _encode_bool,
+    list: _encode_csv,
+    dict: _encode_indexed_dict,
+    **{enum_cls: _encode_scalar for enum_cls in _ENUM_VALUES},
+}
+
+# Encoders for the parameters whose shape is fixed by the client's signatures.
+# Parameters that accept several shapes (e.g. `players`, which is a list in some
+# methods and an enum in others) fall back to `_encode_auto`.
+_ENCODERS = {
+    # platforms is the only list that uses indexed keys
+    "platforms": _encode_indexed_list,
+    "score": _encode_score,
+    "category": _encode_csv,
+    "countries-android": _encode_csv,
+    "countries-ios": _encode_csv,
+    "monetization-android": _encode_csv,
+    "monetization-ios": _encode_csv,
+    "network": _encode_csv,
+    "sub-category": _encode_csv,
+    "tags": _encode_csv,
+    "game_id": _encode_scalar,
+    "limit": _encode_scalar,
+    "monetization": _encode_scalar,
+    "orderBy": _encode_scalar,
+    "page": _encode_scalar,
+    "search": _encode_scalar,
+    "type": _encode_scalar,
+}
+
+
+def _freeze(value: Any) -> Any:
+    """Converts a parameter value into a hashable equivalent."""
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return tuple(value.items())
+    return value
+
+
+def _freeze_typed(value: Any) -> Any:
+    """
+    Like `_freeze`, but also keeps the types, so equal values that validate
+    differently (e.g. `1` and `1.0`) stay apart.
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze_typed(v) for v in value)
+    if isinstance(value, dict):
+        return dict, tuple((k, _freeze_typed(v)) for k, v in value.items())
+    return type(value), value
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Whether a failed request may succeed later: the API could not be reached or
+    failed on its side, rather than rejecting the request itself.
+    """
+    if isinstance(error, (requests.exceptions.HTTPError, httpx.HTTPStatusError)):
+        return error.response.status_code in MiniReviewClient.RETRY_STATUSES
+    return isinstance(
+        error,
+        (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            httpx.TransportError,
+        ),
+    )
+
 
 class MiniReviewClient:
     """A client for the minireview.io API (v2)."""
 
     BASE_URL = "https://minireview.io/apiv2"
+    USER_AGENT = "minireview-client/1"
+    VALIDATED_SIGNATURES_MAXSIZE = 256
+    # How long a response without filters is reused before asking the API again.
+    EMPTY_FILTERS_TTL = 30
+    # Identical GETs within these many seconds are answered from memory. Listings
+    # change as reviews come in; a game's page and its similar games rarely do.
+    RESPONSE_CACHE_TTL = 60
+    RESPONSE_CACHE_TTLS = {
+        "/games": 10,
+        "/games/": 600,  # Game details, `/games/{slug}`
+        "/games-similar": 600,
+        "/upcoming-games": 600,
+    }
+    # How long after expiring a response may still be served if the API fails.
+    RESPONSE_CACHE_STALE_TTL = 3600
+    RESPONSE_CACHE_MAXSIZE = 128
+    # Concurrent page fetches; must not exceed the session's pool size.
+    PAGE_FETCH_WORKERS = 8
+    # Upstream failures that are retried, and that may be answered with a stale
+    # response once the retries run out.
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    RETRIES = 3
+    # Requests in flight per async fan-out, to stay clear of the API's rate limit.
+    MAX_CONCURRENT_REQUESTS = 16
+    KEEPALIVE_EXPIRY = 60
 
-    def __init__(self):
+    def __init__(
+        self,
+        filters_cache_path: str | Path | None = None,
+        filters_cache_ttl: float = 24 * 60 * 60,
+    ):
+        """
+        Args:
+            filters_cache_path: An optional JSON file in which to persist the
+                filters across processes, so a new process can skip fetching them.
+            filters_cache_ttl: How long, in seconds, the persisted filters stay
+                fresh.
+        """
         self._session = requests.Session()
+        # Transient upstream failures are retried with a short backoff. The
+        # session's adapter and `_aget` share this policy.
+        self._retry = Retry(
+            total=self.RETRIES,
+            backoff_factor=0.2,
+            status_forcelist=self.RETRY_STATUSES,
+            # Hand back the last response once the retries run out, so
+            # `raise_for_status` raises an HTTPError that carries its status code.
+            raise_on_status=False,
+        )
+        # All requests go to a single host, so keep one pool of keep-alive
+        # connections large enough for bursts of calls.
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=self._retry),
+        )
+        self._session.headers.update({"User-Agent": self.USER_AGENT})
+        # Created on first use so sync-only callers never open an async pool.
+        self._aclient: httpx.AsyncClient | None = None
+        self._inflight: dict[tuple, asyncio.Future[bytes]] = {}
         self._filters_cache: dict | None = None
+        self._filters_fetched_at = 0.0
+        # Raw response bodies and their expiry times keyed by request, least
+        # recently used first. Bodies are decoded on every hit so callers never
+        # share (and mutate) the same objects.
+        self._response_cache: OrderedDict[tuple, tuple[float, bytes]] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self._filter_index: dict[str, dict[str, str]] | None = None
         self._parsed_filters: dict[str, set[str]] | None = None
+        self._validated_signatures: set[tuple] = set()
+        self._filters_cache_path = (
+            Path(filters_cache_path).expanduser() if filters_cache_path else None
+        )
+        self._filters_cache_ttl = filters_cache_ttl
+
+    def close(self):
+        """Closes the pooled HTTP connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _index_filters(self, raw_filters_list: list[dict]):
+        """
+        Indexes the raw filter data from the API by filter slug.
+        A single pass builds both the option names used by the `get_*` filter
+        helpers and the sets of allowed values used for validation.
+        """
+        self._filter_index = {}
+        self._parsed_filters = {}
+        self._validated_signatures.clear()
+        for f in raw_filters_list or []:
+            options = {item["slug"]: item["nome"] for item in f["itens"]}
+            self._filter_index[f["slug"]] = options
+            self._parsed_filters[f["slug"]] = set(options)
 
     def _init_validator(self):
         """
@@ -37,20 +356,20 @@ class MiniReviewClient:
         This method parses the raw filter data from the API into a
         structure that's quick to check against.
         """
-        if self._parsed_filters is not None:
-            return
-
-        raw_filters_list = self.get_filters()
-        if not raw_filters_list:
-            self._parsed_filters = {}
+        # Empty filters are retried by get_filters once they expire.
+        if self._parsed_filters:
             return
 
-        self._parsed_filters = {
-            f["slug"]: {item["slug"] for item in f["itens"]} for f in raw_filters_list
-        }
+        # get_filters indexes the filters as it fills its cache; index here only
+        # if that didn't happen (e.g. get_filters was replaced).
+        filters = self.get_filters()
+        if self._parsed_filters is None:
+            self._index_filters(filters)
 
-    def _validate_score_param(self, score_value: dict[str, Any]):
+    def _validate_score_param(self, score_value: dict[str, Any] | None):
         """Validates the 'score' parameter."""
+        if score_value is None:
+            return
         if not isinstance(score_value, dict):
             raise ValueError("Score parameter must be a dictionary.")
 
@@ -69,11 +388,10 @@ class MiniReviewClient:
         if value is None:
             return
         allowed_values = self._parsed_filters[key]
-        values_to_check = value if isinstance(value, list) else [value]
+        values_to_check = value if isinstance(value, (list, tuple)) else [value]
 
         for v in values_to_check:
-            actual_value = v.value if isinstance(v, Enum) else v
-            if actual_value not in allowed_values:
+            if _coerce(v) not in allowed_values:
                 raise ValueError(
                     f"Invalid value for filter '{key}': '{v}'. "
                     "Check get_filters() for options."
@@ -87,12 +405,26 @@ class MiniReviewClient:
         self._init_validator()
         assert self._parsed_filters is not None
 
+        # Repeated calls with the same filters (e.g. paginating) skip re-checking
+        # values that already passed validation.
+        signature = tuple(
+            (key, _freeze_typed(value))
+            for key, value in params.items()
+            if key == "score" or key in self._parsed_filters
+        )
+        if signature in self._validated_signatures:
+            return
+
         for key, value in params.items():
             if key == "score":
                 self._validate_score_param(value)
             elif key in self._parsed_filters:
                 self._validate_filter_param(key, value)
 
+        if len(self._validated_signatures) >= self.VALIDATED_SIGNATURES_MAXSIZE:
+            self._validated_signatures.clear()
+        self._validated_signatures.add(signature)
+
     def _build_params(
         self, params: dict[str, Any], is_validate: bool = False
     ) -> dict[str, Any]:
@@ -112,39 +444,66 @@ class MiniReviewClient:
 
         processed_params = {}
         for key, value in params.items():
-            if value is None or value in ([], {}, ""):
+            if value is None or (
+                isinstance(value, (list, tuple, dict, str)) and not value
+            ):
                 continue
-
-            if isinstance(value, Enum):
-                processed_params[key] = value.value
-            elif isinstance(value, list):
-                # platforms is the only list that uses indexed keys
-                if key == "platforms":
-                    for i, v in enumerate(value):
-                        processed_params[f"{key}[{i}]"] = (
-                            v.value if isinstance(v, Enum) else v
-                        )
-                # All other lists are comma-separated
-                else:
-                    processed_params[key] = ",".join(
-                        [str(v.value if isinstance(v, Enum) else v) for v in value]
-                    )
-            elif isinstance(value, dict):
-                # Custom handling for "score"
-                if key == "score":
-                    processed_params[key] = ",".join(
-                        [f"{s}-{v}" for s, v in value.items()]
-                    )
-                else:
-                    for s, v in value.items():
-                        processed_params[f"{key}[{s}]"] = v
-            elif isinstance(value, bool):
-                processed_params[key] = 1 if value else 0
-            else:
-                processed_params[key] = value
+            _ENCODERS.get(key, _encode_auto)(processed_params, key, value)
 
         return processed_params
 
+    @staticmethod
+    def _response_cache_key(endpoint: str, params: dict | None) -> tuple:
+        """Returns a hashable key for a request."""
+        if not params:
+            return (endpoint, frozenset())
+        try:
+            # Built params are flat strings, so this is a single C-level pass.
+            return (endpoint, frozenset(params.items()))
+        except TypeError:
+            return (endpoint, frozenset((k, _freeze(v)) for k, v in params.items()))
+
+    def _response_cache_ttl(self, endpoint: str) -> float:
+        """Returns how long responses from an endpoint stay fresh."""
+        ttl = self.RESPONSE_CACHE_TTLS.get(endpoint)
+        if ttl is None:
+            parent = endpoint.rsplit("/", 1)[0] + "/"
+            ttl = self.RESPONSE_CACHE_TTLS.get(parent, self.RESPONSE_CACHE_TTL)
+        return ttl
+
+    def _get_cached_response(self, key: tuple, stale: bool = False) -> bytes | None:
+        """
+        Returns a cached response body, or None. Expired bodies are only returned
+        if `stale` is set and they are still within the stale window.
+        """
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is None:
+                return None
+            expires_at, content = cached
+            now = time.monotonic()
+            if now >= expires_at + self.RESPONSE_CACHE_STALE_TTL:
+                del self._response_cache[key]
+                return None
+            if now >= expires_at and not stale:
+                return None
+            self._response_cache.move_to_end(key)
+            return content
+
+    def _cache_response(self, key: tuple, content: bytes):
+        """Caches a response body, evicting the least recently used ones."""
+        expires_at = time.monotonic() + self._response_cache_ttl(key[0])
+        with self._response_cache_lock:
+            self._response_cache[key] = (expires_at, content)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.RESPONSE_CACHE_MAXSIZE:
+                self._response_cache.popitem(last=False)
+
+    def clear_response_cache(self):
+        """Forgets every cached response, including those kept to serve on errors."""
+        with self._response_cache_lock:
+            self._response_cache.clear()
+
     def _fetch_api(self, endpoint: str, params: dict | None = None) -> dict:
         """
         A private method to fetch data from the minireview.io API.
@@ -159,15 +518,170 @@ class MiniReviewClient:
         Raises:
             APIError: If the API returns an error.
         """
+        key = self._response_cache_key(endpoint, params)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return _loads(cached)
+
         url = f"{self.BASE_URL}{endpoint}"
         try:
             response = self._session.get(url, params=params)
             response.raise_for_status()  # Raise an exception for bad status codes
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            raise APIError(
-                f"An error occurred while fetching data from {url}: {e}"
-            ) from e
+            data = _loads(response.content)
+        # Invalid JSON raises a ValueError from either decoder.
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # Prefer a recently expired response over failing, unless the API
+            # rejected the request, which it would do again.
+            stale = _is_transient(e) and self._get_cached_response(key, stale=True)
+            if stale:
+                return _loads(stale)
+            raise APIError(url=url, cause=e) from e
+        self._cache_response(key, response.content)
+        return data
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        """Returns the pooled async HTTP client, creating it on first use."""
+        if self._aclient is None:
+            transport = httpx.AsyncHTTPTransport(
+                # HTTP/2 needs the optional `h2` package (`httpx[http2]`).
+                http2=importlib.util.find_spec("h2") is not None,
+                # Tool calls are often further apart than httpx's 5s default, so
+                # keep idle connections around to skip the TLS handshake.
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY,
+                ),
+                # Like the session, retry connections that fail to open.
+                retries=self.RETRIES,
+            )
+            self._aclient = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                transport=transport,
+                headers={"User-Agent": self.USER_AGENT},
+            )
+        return self._aclient
+
+    async def _afetch_api(self, endpoint: str, params: dict | None = None) -> dict:
+        """
+        The async counterpart of `_fetch_api`.
+
+        Args:
+            endpoint: The API endpoint to call (e.g., '/games').
+            params: A dictionary of query parameters.
+
+        Returns:
+            The JSON response from the API.
+
+        Raises:
+            APIError: If the API returns an error.
+        """
+        key = self._response_cache_key(endpoint, params)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return _loads(cached)
+
+        url = f"{self.BASE_URL}{endpoint}"
+        try:
+            content = await self._aget_shared(key, endpoint, params)
+            data = _loads(content)
+        except (httpx.HTTPError, ValueError) as e:
+            stale = _is_transient(e) and self._get_cached_response(key, stale=True)
+            if stale:
+                return _loads(stale)
+            raise APIError(url=url, cause=e) from e
+        self._cache_response(key, content)
+        return data
+
+    def _aget_shared(
+        self, key: tuple, endpoint: str, params: dict | None
+    ) -> asyncio.Future[bytes]:
+        """
+        Returns an awaitable for the response body of a request. Identical
+        requests already in flight share it, so a burst of them hits the API once.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._aget(endpoint, params))
+            self._inflight[key] = task
+
+            def done(task):
+                self._inflight.pop(key, None)
+                if not task.cancelled():
+                    task.exception()  # Retrieved even if every caller went away.
+
+            task.add_done_callback(done)
+        # A cancelled caller must not cancel the request for the others.
+        return asyncio.shield(task)
+
+    async def _aget(self, endpoint: str, params: dict | None) -> bytes:
+        """
+        Fetches the raw body of a successful response. Failed responses are
+        retried with the session's retry policy, honoring `Retry-After`.
+        """
+        aclient = self._get_aclient()
+        retry = self._retry
+        while True:
+            response = await aclient.get(endpoint, params=params)
+            has_retry_after = "Retry-After" in response.headers
+            if not retry.is_retry("GET", response.status_code, has_retry_after):
+                break
+            try:
+                retry = retry.increment("GET", str(response.url))
+            except MaxRetryError:
+                break
+            await asyncio.sleep(
+                retry.get_retry_after(response) or retry.get_backoff_time()
+            )
+        response.raise_for_status()
+        return response.content
+
+    async def _agather(self, awaitables: Iterable[Awaitable]) -> list:
+        """
+        Awaits concurrently, with at most `MAX_CONCURRENT_REQUESTS` in flight.
+
+        Returns:
+            The results, in the same order as `awaitables`.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def limited(awaitable):
+            async with semaphore:
+                return await awaitable
+
+        return list(await asyncio.gather(*map(limited, awaitables)))
+
+    async def _aclose(self):
+        """Closes the async connection pool, if it was opened."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def _load_persisted_filters(self) -> list | None:
+        """Returns the persisted filters, or None if they are missing or stale."""
+        path = self._filters_cache_path
+        try:
+            if time.time() - path.stat().st_mtime > self._filters_cache_ttl:
+                return None
+            return _loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _persist_filters(self, filters: list):
+        """Atomically writes the filters to the cache file, ignoring failures."""
+        path = self._filters_cache_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(filters, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
 
     def get_filters(self) -> dict:
         """
@@ -175,34 +689,85 @@ class MiniReviewClient:
 
         The 'filtros' object in the API response contains a wealth of metadata
         about the available filters. This function retrieves that object and
-        caches it for the lifetime of the client instance.
+        caches it for the lifetime of the client instance, indexing it for the
+        filter option helpers and parameter validation in the same pass. If a
+        `filters_cache_path` was given, fresh filters persisted there by an
+        earlier process are used instead of calling the API.
 
         Returns:
             A dictionary representing the 'filtros' object.
         """
-        if self._filters_cache:
-            return self._filters_cache
+        filters = self._get_cached_filters()
+        if filters is not None:
+            return filters
 
         # We only need one game to get the 'filtros' object
         # We call _build_params directly to avoid a validation circular dependency
         params = self._build_params({"limit": 1})
-        games_data = self._fetch_api("/games", params)
+        return self._store_filters(self._fetch_api("/games", params))
 
+    def clear_filters_cache(self):
+        """Forgets the cached filters, including any persisted to disk."""
+        self._filters_cache = None
+        self._filter_index = None
+        self._parsed_filters = None
+        self._validated_signatures.clear()
+        if self._filters_cache_path:
+            self._filters_cache_path.unlink(missing_ok=True)
+        # The filters come from a cached /games response, which must go too.
+        key = self._response_cache_key("/games", self._build_params({"limit": 1}))
+        with self._response_cache_lock:
+            self._response_cache.pop(key, None)
+
+    def _get_cached_filters(self) -> dict | None:
+        """Returns the filters from memory or disk, or None if they must be fetched."""
+        if self._filters_cache:
+            return self._filters_cache
+        if (
+            self._filters_cache is not None
+            and time.monotonic() - self._filters_fetched_at < self.EMPTY_FILTERS_TTL
+        ):
+            return self._filters_cache
+
+        if self._filters_cache_path:
+            persisted = self._load_persisted_filters()
+            if persisted:
+                try:
+                    self._index_filters(persisted)
+                except (AttributeError, KeyError, TypeError):
+                    # Valid JSON that isn't a filters list: drop it and refetch.
+                    self._filter_index = self._parsed_filters = None
+                    self._filters_cache_path.unlink(missing_ok=True)
+                    return None
+                self._filters_cache = persisted
+                return persisted
+        return None
+
+    def _store_filters(self, games_data: dict) -> dict:
+        """Caches and indexes the filters from a /games response."""
         if "filtros" in games_data:
             self._filters_cache = games_data["filtros"]
+            self._index_filters(self._filters_cache)
+            if self._filters_cache_path:
+                self._persist_filters(self._filters_cache)
             return self._filters_cache
 
-        return {}
+        # Remember the miss for a while so a flaky upstream isn't asked again
+        # on every call.
+        self._filters_cache = {}
+        self._filters_fetched_at = time.monotonic()
+        self._index_filters([])
+        return self._filters_cache
 
     def _get_filter_options(self, filter_slug: str) -> dict:
         """
         A generic helper to fetch options for a given filter slug.
+        Returns a copy, so callers can't change the index used for validation.
         """
         filters = self.get_filters()
-        for f in filters:
-            if f["slug"] == filter_slug:
-                return {item["slug"]: item["nome"] for item in f["itens"]}
-        return {}
+        if not self._filter_index:
+            self._index_filters(filters)
+        return dict(self._filter_index.get(filter_slug, {}))
 
     def get_players(self) -> dict:
         return self._get_filter_options("players")
@@ -243,28 +808,24 @@ class MiniReviewClient:
         limit: int = 50,
         search: str = "",
         orderBy: GamesListOrderBy = GamesListOrderBy.LAST_ADDED_REVIEWS,
-        platforms: list[Platform] = [Platform.ANDROID, Platform.IOS],
-        players: list[str] = [],
-        network: list[str] = [],
-        monetization_android: list[str] = [],
-        monetization_ios: list[str] = [],
-        screen_orientation: list[str] = [],
-        category: list[str] = [],
-        sub_category: list[str] = [],
-        tags: list[str] = [],
-        countries_android: list[str] = [],
-        countries_ios: list[str] = [],
-        score: dict[str, int] = {},
+        platforms: Sequence[Platform] = _DEFAULT_PLATFORMS,
+        players: list[str] | None = None,
+        network: list[str] | None = None,
+        monetization_android: list[str] | None = None,
+        monetization_ios: list[str] | None = None,
+        screen_orientation: list[str] | None = None,
+        category: list[str] | None = None,
+        sub_category: list[str] | None = None,
+        tags: list[str] | None = None,
+        countries_android: list[str] | None = None,
+        countries_ios: list[str] | None = None,
+        score: dict[str, int] | None = None,
     ) -> dict:
         """
         Fetches a list of games with extensive filtering capabilities.
         """
-        if not isinstance(orderBy, GamesListOrderBy):
-            raise TypeError("orderBy must be a member of the GamesListOrderBy enum")
-        if not all(isinstance(p, Platform) for p in platforms):
-            raise TypeError(
-                "All items in platforms must be members of the Platform enum"
-            )
+        orderBy = _to_enum(GamesListOrderBy, orderBy, "orderBy")
+        platforms = _to_platforms(platforms)
 
         params = {
             "page": page,
@@ -286,6 +847,30 @@ class MiniReviewClient:
         }
         return self._fetch_api("/games", self._build_params(params, is_validate=True))
 
+    def get_games_list_pages(self, pages: Iterable[int], **filters) -> list[dict]:
+        """
+        Fetches several pages of `get_games_list` concurrently.
+
+        The requests share the client's pooled session, which is safe for
+        independent GETs to the same host, so at most `PAGE_FETCH_WORKERS`
+        connections are used.
+
+        Args:
+            pages: The page numbers to fetch.
+            **filters: Any other `get_games_list` arguments, applied to every page.
+
+        Returns:
+            The responses, in the same order as `pages`.
+        """
+        # Load the filters once up front instead of in every worker.
+        self._init_validator()
+        with ThreadPoolExecutor(max_workers=self.PAGE_FETCH_WORKERS) as executor:
+            return list(
+                executor.map(
+                    lambda page: self.get_games_list(page=page, **filters), pages
+                )
+            )
+
     def get_game_details(self, game_slug: str, category: str) -> dict:
         """
         Fetches details for a specific game.
@@ -309,10 +894,8 @@ class MiniReviewClient:
         """
         Fetches ratings for a specific game.
         """
-        if not isinstance(type, GameRatingType):
-            raise TypeError("type must be a member of the GameRatingType enum")
-        if not isinstance(orderBy, GameRatingsOrderBy):
-            raise TypeError("orderBy must be a member of the GameRatingsOrderBy enum")
+        type = _to_enum(GameRatingType, type, "type")
+        orderBy = _to_enum(GameRatingsOrderBy, orderBy, "orderBy")
 
         params = {
             "game_id": game_id,
@@ -330,7 +913,7 @@ class MiniReviewClient:
         game_id: int,
         page: int = 1,
         limit: int = 50,
-        platforms: list[Platform] = [Platform.ANDROID, Platform.IOS],
+        platforms: Sequence[Platform] = _DEFAULT_PLATFORMS,
         monetization: Monetization | None = None,
         players: Players | None = None,
         screen_orientation: ScreenOrientation | None = None,
@@ -338,19 +921,14 @@ class MiniReviewClient:
         """
         Fetches games similar to a specific game.
         """
-        if not all(isinstance(p, Platform) for p in platforms):
-            raise TypeError(
-                "All items in platforms must be members of the Platform enum"
-            )
-        if monetization is not None and not isinstance(monetization, Monetization):
-            raise TypeError("monetization must be a member of the Monetization enum")
-        if players is not None and not isinstance(players, Players):
-            raise TypeError("players must be a member of the Players enum")
-        if screen_orientation is not None and not isinstance(
-            screen_orientation, ScreenOrientation
-        ):
-            raise TypeError(
-                "screen_orientation must be a member of the ScreenOrientation enum"
+        platforms = _to_platforms(platforms)
+        if monetization is not None:
+            monetization = _to_enum(Monetization, monetization, "monetization")
+        if players is not None:
+            players = _to_enum(Players, players, "players")
+        if screen_orientation is not None:
+            screen_orientation = _to_enum(
+                ScreenOrientation, screen_orientation, "screen_orientation"
             )
 
         params = {
@@ -369,19 +947,15 @@ class MiniReviewClient:
     def get_home(
         self,
         page: int = 1,
-        platforms: list[Platform] = [Platform.ANDROID, Platform.IOS],
-        ids_ignore: list[int] = [],
+        platforms: Sequence[Platform] = _DEFAULT_PLATFORMS,
+        ids_ignore: list[int] | None = None,
         orderBy: GamesListOrderBy = GamesListOrderBy.LAST_ADDED_REVIEWS,
     ) -> dict:
         """
         Fetches the home page content.
         """
-        if not all(isinstance(p, Platform) for p in platforms):
-            raise TypeError(
-                "All items in platforms must be members of the Platform enum"
-            )
-        if not isinstance(orderBy, GamesListOrderBy):
-            raise TypeError("orderBy must be a member of the GamesListOrderBy enum")
+        platforms = _to_platforms(platforms)
+        orderBy = _to_enum(GamesListOrderBy, orderBy, "orderBy")
 
         params = {
             "page": page,
@@ -395,26 +969,23 @@ class MiniReviewClient:
         self,
         page: int = 1,
         limit: int = 50,
-        platforms: list[Platform] = [Platform.ANDROID, Platform.IOS],
-        players: list[str] = [],
-        network: list[str] = [],
-        monetization_android: list[str] = [],
-        monetization_ios: list[str] = [],
-        screen_orientation: list[str] = [],
-        category: list[str] = [],
-        sub_category: list[str] = [],
-        tags: list[str] = [],
-        countries_android: list[str] = [],
-        countries_ios: list[str] = [],
-        score: dict[str, int] = {},
+        platforms: Sequence[Platform] = _DEFAULT_PLATFORMS,
+        players: list[str] | None = None,
+        network: list[str] | None = None,
+        monetization_android: list[str] | None = None,
+        monetization_ios: list[str] | None = None,
+        screen_orientation: list[str] | None = None,
+        category: list[str] | None = None,
+        sub_category: list[str] | None = None,
+        tags: list[str] | None = None,
+        countries_android: list[str] | None = None,
+        countries_ios: list[str] | None = None,
+        score: dict[str, int] | None = None,
     ) -> dict:
         """
         Fetches games of the week.
         """
-        if not all(isinstance(p, Platform) for p in platforms):
-            raise TypeError(
-                "All items in platforms must be members of the Platform enum"
-            )
+        platforms = _to_platforms(platforms)
 
         params = {
             "type": "games-of-the-week",
@@ -440,26 +1011,23 @@ class MiniReviewClient:
         self,
         page: int = 1,
         limit: int = 50,
-        platforms: list[Platform] = [Platform.ANDROID, Platform.IOS],
-        players: list[str] = [],
-        network: list[str] = [],
-        monetization_android: list[str] = [],
-        monetization_ios: list[str] = [],
-        screen_orientation: list[str] = [],
-        category: list[str] = [],
-        sub_category: list[str] = [],
-        tags: list[str] = [],
-        countries_android: list[str] = [],
-        countries_ios: list[str] = [],
-        score: dict[str, int] = {},
+        platforms: Sequence[Platform] = _DEFAULT_PLATFORMS,
+        players: list[str] | None = None,
+        network: list[str] | None = None,
+        monetization_android: list[str] | None = None,
+        monetization_ios: list[str] | None = None,
+        screen_orientation: list[str] | None = None,
+        category: list[str] | None = None,
+        sub_category: list[str] | None = None,
+        tags: list[str] | None = None,
+        countries_android: list[str] | None = None,
+        countries_ios: list[str] | None = None,
+        score: dict[str, int] | None = None,
     ) -> dict:
         """
         Fetches games that are MiniReview picks.
         """
-        if not all(isinstance(p, Platform) for p in platforms):
-            raise TypeError(
-                "All items in platforms must be members of the Platform enum"
-            )
+        platforms = _to_platforms(platforms)
 
         params = {
             "type": "our-pick",
@@ -486,19 +1054,13 @@ class MiniReviewClient:
         page: int = 1,
         limit: int = 50,
         orderBy: TopUserRatingsOrderBy = TopUserRatingsOrderBy.THIS_WEEK,
-        platforms: list[Platform] = [Platform.ANDROID, Platform.IOS],
+        platforms: Sequence[Platform] = _DEFAULT_PLATFORMS,
     ) -> dict:
         """
         Fetches top user ratings.
         """
-        if not isinstance(orderBy, TopUserRatingsOrderBy):
-            raise TypeError(
-                "orderBy must be a member of the TopUserRatingsOrderBy enum"
-            )
-        if not all(isinstance(p, Platform) for p in platforms):
-            raise TypeError(
-                "All items in platforms must be members of the Platform enum"
-            )
+        orderBy = _to_enum(TopUserRatingsOrderBy, orderBy, "orderBy")
+        platforms = _to_platforms(platforms)
 
         params = {
             "page": page,
@@ -515,17 +1077,13 @@ class MiniReviewClient:
         page: int = 1,
         limit: int = 50,
         orderBy: GamesListOrderBy = GamesListOrderBy.RELEASE_DATE,
-        platforms: list[Platform] = [Platform.ANDROID, Platform.IOS],
+        platforms: Sequence[Platform] = _DEFAULT_PLATFORMS,
     ) -> dict:
         """
         Fetches upcoming games.
         """
-        if not isinstance(orderBy, GamesListOrderBy):
-            raise TypeError("orderBy must be a member of the GamesListOrderBy enum")
-        if not all(isinstance(p, Platform) for p in platforms):
-            raise TypeError(
-                "All items in platforms must be members of the Platform enum"
-            )
+        orderBy = _to_enum(GamesListOrderBy, orderBy, "orderBy")
+        platforms = _to_platforms(platforms)
 
         params = {
             "page": page,
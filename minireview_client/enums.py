@@ -2,10 +2,19 @@
 Enums for fixed-value parameters in the minireview.io API client.
 """
 
-from enum import Enum
+try:
+    from enum import StrEnum
+except ImportError:  # pragma: no cover - Python < 3.11
+    from enum import Enum
 
+    class StrEnum(str, Enum):
+        """Backport of `enum.StrEnum`: members are their string values."""
 
-class GamesListOrderBy(Enum):
+        def __str__(self):
+            return self.value
+
+
+class GamesListOrderBy(StrEnum):
     """Represents the available sorting options for game lists."""
 
     LAST_ADDED_REVIEWS = "last-added-reviews"
@@ -18,7 +27,7 @@ class GamesListOrderBy(Enum):
     HIGHEST_APP_STORE_SCORE = "highest-appStore-score"
 
 
-class UpComingGamesOrderBy(Enum):
+class UpComingGamesOrderBy(StrEnum):
     """Represents the available sorting options for upcoming games."""
 
     LAUNCH_DATE = "launch-date"
@@ -26,7 +35,7 @@ class UpComingGamesOrderBy(Enum):
     HYPE_LEVEL = "hype-level"
 
 
-class GameRatingsOrderBy(Enum):
+class GameRatingsOrderBy(StrEnum):
     """Represents the available sorting options for game ratings."""
 
     NEWEST = "newest"
@@ -34,14 +43,14 @@ class GameRatingsOrderBy(Enum):
     MOST_RELEVANT = "most-relevant"
 
 
-class Platform(Enum):
+class Platform(StrEnum):
     """Represents the available platforms."""
 
     ANDROID = "android"
     IOS = "ios"
 
 
-class GameRatingType(Enum):
+class GameRatingType(StrEnum):
     """Represents the available game rating types."""
 
     ALL = "all"
@@ -49,7 +58,7 @@ class GameRatingType(Enum):
     NEGATIVE = "negative"
 
 
-class TopUserRatingsOrderBy(Enum):
+class TopUserRatingsOrderBy(StrEnum):
     """Represents the available sorting options for top user ratings."""
 
     THIS_WEEK = "this-week"
@@ -57,21 +66,21 @@ class TopUserRatingsOrderBy(Enum):
     ALL_TIME = "all-time"
 
 
-class Monetization(Enum):
+class Monetization(StrEnum):
     """Represents the available monetization types."""
 
     FREE = "free"
     PAID = "paid"
 
 
-class Players(Enum):
+class Players(StrEnum):
     """Represents the available player types."""
 
     SINGLE_PLAYER = "singleplayer"
     MULTI_PLAYER = "multiplayer"
 
 
-class ScreenOrientation(Enum):
+class ScreenOrientation(StrEnum):
     """Represents the available screen orientations."""
 
     PORTRAIT = "portrait"
@@ -4,6 +4,31 @@ Custom exceptions for the minireview.io API client.
 
 
 class APIError(Exception):
-    """Base class for API errors."""
+    """
+    Raised when a request to the API fails.
 
-    pass
+    Attributes:
+        url: The URL that was requested, if known.
+        cause: The underlying exception, if any.
+        status_code: The HTTP status code of the response, if there was one.
+    """
+
+    def __init__(
+        self,
+        message: str | None = None,
+        *,
+        url: str | None = None,
+        cause: Exception | None = None,
+    ):
+        super().__init__(*([] if message is None else [message]))
+        self.message = message
+        self.url = url
+        self.cause = cause
+        # Both requests' and httpx's HTTP errors carry the failed response.
+        response = getattr(cause, "response", None)
+        self.status_code: int | None = getattr(response, "status_code", None)
+
+    def __str__(self):
+        if self.message is not None:
+            return self.message
+        return f"An error occurred while fetching data from {self.url}: {self.cause}"
@@ -1,6 +1,13 @@
+import contextlib
+import functools
+import importlib.util
+import os
+from collections.abc import AsyncIterator
+
+import anyio
 from fastmcp import FastMCP
 
-from minireview_client.client import MiniReviewClient
+from minireview_client.async_client import AsyncMiniReviewClient
 from minireview_client.enums import (
     GameRatingsOrderBy,
     GameRatingType,
@@ -9,11 +16,33 @@ from minireview_client.enums import (
     TopUserRatingsOrderBy,
 )
 
-app = FastMCP()
-client = MiniReviewClient()
+# The server is usually restarted per session, so persist the filters to skip
+# re-fetching them on every start. Set the variable to an empty string to disable.
+# The tools are coroutines so a request in flight never blocks the event loop.
+client = AsyncMiniReviewClient(
+    filters_cache_path=os.getenv(
+        "MINIREVIEW_FILTERS_CACHE", "~/.cache/minireview/filters.json"
+    )
+)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    """Closes the client's async connection pool when the server shuts down."""
+    try:
+        yield {}
+    finally:
+        await client.aclose()
+
+
+app = FastMCP(lifespan=lifespan)
 
+# The tools return plain dicts, and their only output schema is "object", so skip
+# validating every result against it and advertise them as unstructured.
+tool = functools.partial(app.tool, output_schema=None)
 
-@app.tool(
+
+@tool(
     title="Fetch Games List",
     description=(
         "Fetches a paginated list of games with extensive filtering and sorting "
@@ -21,7 +50,7 @@ client = MiniReviewClient()
         "corresponding `get_*_options` functions."
     ),
 )
-def get_games_list(
+async def get_games_list(
     page: int = 1,
     limit: int = 50,
     search: str = "",
@@ -74,7 +103,7 @@ def get_games_list(
         A dictionary containing a list of games, and pagination information
         including the current page, total pages, and whether it is the last page.
     """
-    games_list_res = client.get_games_list(
+    games_list_res = await client.get_games_list(
         page=page,
         limit=limit,
         orderBy=orderBy,
@@ -92,6 +121,11 @@ def get_games_list(
         score=score,
     )
 
+    return _format_games_list(games_list_res)
+
+
+def _format_games_list(games_list_res: dict) -> dict:
+    """Trims and translates a page of games."""
     games_list_data = [
         {
             "id": game_list_data_item.get("id"),
@@ -118,7 +152,7 @@ def get_games_list(
             "week": game_list_data_item.get("semana"),
             "price": game_list_data_item.get("price"),
         }
-        for game_list_data_item in games_list_res.get("data")
+        for game_list_data_item in games_list_res["data"]
     ]
 
     return {
@@ -129,13 +163,13 @@ def get_games_list(
     }
 
 
-@app.tool(
+@tool(
     title="Get Game Details",
     description=(
         "Fetches detailed information for a single game by its slug and category."
     ),
 )
-def get_game_details(game_slug: str, category: str) -> dict:
+async def get_game_details(game_slug: str, category: str) -> dict:
     """
     Fetches detailed information for a specific game.
 
@@ -148,8 +182,12 @@ def get_game_details(game_slug: str, category: str) -> dict:
         score, total reviews, platform, category, subcategory, categories, top game,
         minireview pick, game of the week, description, review, specs, and tags.
     """
-    game_details = client.get_game_details(game_slug, category)
-    game_details_data = game_details.get("data")
+    return _format_game_details(await client.get_game_details(game_slug, category))
+
+
+def _format_game_details(game_details: dict) -> dict:
+    """Trims and translates a game details response."""
+    game_details_data = game_details["data"]
 
     return {
         "id": game_details_data.get("id"),
@@ -186,11 +224,11 @@ def get_game_details(game_slug: str, category: str) -> dict:
     }
 
 
-@app.tool(
+@tool(
     title="Get Game Ratings",
     description="Fetches a list of user ratings for a specific game.",
 )
-def get_game_ratings(
+async def get_game_ratings(
     game_id: int,
     page: int = 1,
     limit: int = 50,
@@ -212,8 +250,13 @@ def get_game_ratings(
         including the current page, total ratings, total positive ratings,
         total negative ratings, and whether it is the last page.
     """
-    game_ratings_res = client.get_game_ratings(game_id, page, limit, type, orderBy)
+    return _format_game_ratings(
+        await client.get_game_ratings(game_id, page, limit, type, orderBy)
+    )
 
+
+def _format_game_ratings(game_ratings_res: dict) -> dict:
+    """Trims and translates a game ratings response."""
     game_rating_data = [
         {
             "id": game_ratings_data_item.get("id"),
@@ -222,7 +265,7 @@ def get_game_ratings(
             "text": game_ratings_data_item.get("texto"),
             "type": game_ratings_data_item.get("tipo"),
         }
-        for game_ratings_data_item in game_ratings_res.get("data")
+        for game_ratings_data_item in game_ratings_res["data"]
     ]
 
     return {
@@ -236,11 +279,11 @@ def get_game_ratings(
     }
 
 
-@app.tool(
+@tool(
     title="Get Similar Games",
     description="Fetches a list of games similar to a specific game.",
 )
-def get_similar_games(
+async def get_similar_games(
     game_id: int,
     page: int = 1,
     limit: int = 50,
@@ -260,8 +303,13 @@ def get_similar_games(
         A dictionary containing a list of similar games, the total number of games,
         and whether it is the last page.
     """
-    similar_games_res = client.get_similar_games(game_id, page, limit, platforms)
+    return _format_similar_games(
+        await client.get_similar_games(game_id, page, limit, platforms)
+    )
 
+
+def _format_similar_games(similar_games_res: dict) -> dict:
+    """Trims and translates a similar games response."""
     similar_games_data = [
         {
             "id": similar_games_data_item.get("id"),
@@ -282,7 +330,7 @@ def get_similar_games(
             "description": similar_games_data_item.get("descricao"),
             "price": similar_games_data_item.get("price"),
         }
-        for similar_games_data_item in similar_games_res.get("data")
+        for similar_games_data_item in similar_games_res["data"]
     ]
 
     return {
@@ -292,7 +340,46 @@ def get_similar_games(
     }
 
 
-@app.tool(
+@tool(
+    title="Get Game Bundle",
+    description=(
+        "Fetches a game's details, its newest ratings and similar games in a single "
+        "call. Prefer this over calling `get_game_details`, `get_game_ratings` and "
+        "`get_similar_games` one after another for the same game."
+    ),
+)
+async def get_game_bundle(
+    game_slug: str,
+    category: str,
+    game_id: int,
+    limit: int = 50,
+    platforms: list[Platform] = [],
+) -> dict:
+    """
+    Fetches the details, ratings and similar games of a game concurrently.
+
+    Args:
+        game_slug: The slug of the game (e.g., 'seven-knights-idle-adventure').
+        category: The category of the game.
+        game_id: The ID of the game.
+        limit: The number of ratings and of similar games to fetch.
+        platforms: A list of platforms to filter the similar games by.
+
+    Returns:
+        A dictionary with the game's `details`, `ratings` and `similar_games`, in
+        the same format as the corresponding tools.
+    """
+    bundle = await client.get_game_bundle(
+        game_slug, category, game_id, limit, platforms
+    )
+    return {
+        "details": _format_game_details(bundle["details"]),
+        "ratings": _format_game_ratings(bundle["ratings"]),
+        "similar_games": _format_similar_games(bundle["similar"]),
+    }
+
+
+@tool(
     title="Get All Filters",
     description=(
         "Fetches all available filter options for games, such as categories, tags, "
@@ -300,7 +387,7 @@ def get_similar_games(
         "functions."
     ),
 )
-def get_all_filters() -> dict:
+async def get_all_filters() -> dict:
     """
     Fetches all available filter options for games, such as categories, tags,
     and monetization types.
@@ -309,194 +396,194 @@ def get_all_filters() -> dict:
         A dictionary containing all available filter options.
     """
     return {
-        "players": client.get_players(),
-        "network": client.get_network_options(),
-        "monetization_android": client.get_monetization_android(),
-        "monetization_ios": client.get_monetization_ios(),
-        "screen_orientation": client.get_screen_orientation_options(),
-        "category": client.get_category_options(),
-        "sub_category": client.get_sub_category_options(),
-        "tags": client.get_tags(),
-        "countries_android": client.get_countries_android(),
-        "countries_ios": client.get_countries_ios(),
-        "score": client.get_score_options(),
+        "players": await client.get_players(),
+        "network": await client.get_network_options(),
+        "monetization_android": await client.get_monetization_android(),
+        "monetization_ios": await client.get_monetization_ios(),
+        "screen_orientation": await client.get_screen_orientation_options(),
+        "category": await client.get_category_options(),
+        "sub_category": await client.get_sub_category_options(),
+        "tags": await client.get_tags(),
+        "countries_android": await client.get_countries_android(),
+        "countries_ios": await client.get_countries_ios(),
+        "score": await client.get_score_options(),
     }
 
 
-@app.tool(
+@tool(
     title="Get Player Options",
     description=(
         "Fetches all available player mode filter options (e.g., 'singleplayer')."
     ),
 )
-def get_player_options() -> dict:
+async def get_player_options() -> dict:
     """
     Fetches available player mode options.
 
     Returns:
         A dictionary containing the available player mode options.
     """
-    return {"options": client.get_players()}
+    return {"options": await client.get_players()}
 
 
-@app.tool(
+@tool(
     title="Get Network Options",
     description=(
         "Fetches all available network mode filter options (e.g., 'online', 'offline')."
     ),
 )
-def get_network_options() -> dict:
+async def get_network_options() -> dict:
     """
     Fetches available network options.
 
     Returns:
         A dictionary containing the available network options.
     """
-    return {"options": client.get_network_options()}
+    return {"options": await client.get_network_options()}
 
 
-@app.tool(
+@tool(
     title="Get Android Monetization Options",
     description=(
         "Fetches all available monetization filter options for the Android platform."
     ),
 )
-def get_monetization_android_options() -> dict:
+async def get_monetization_android_options() -> dict:
     """
     Fetches available monetization options for Android.
 
     Returns:
         A dictionary containing the available monetization options for Android.
     """
-    return {"options": client.get_monetization_android()}
+    return {"options": await client.get_monetization_android()}
 
 
-@app.tool(
+@tool(
     title="Get iOS Monetization Options",
     description=(
         "Fetches all available monetization filter options for the iOS platform."
     ),
 )
-def get_monetization_ios_options() -> dict:
+async def get_monetization_ios_options() -> dict:
     """
     Fetches available monetization options for iOS.
 
     Returns:
         A dictionary containing the available monetization options for iOS.
     """
-    return {"options": client.get_monetization_ios()}
+    return {"options": await client.get_monetization_ios()}
 
 
-@app.tool(
+@tool(
     title="Get Screen Orientation Options",
     description="Fetches all available screen orientation filter options.",
 )
-def get_screen_orientation_options() -> dict:
+async def get_screen_orientation_options() -> dict:
     """
     Fetches available screen orientation options.
 
     Returns:
         A dictionary containing the available screen orientation options.
     """
-    return {"options": client.get_screen_orientation_options()}
+    return {"options": await client.get_screen_orientation_options()}
 
 
-@app.tool(
+@tool(
     title="Get Category Options",
     description="Fetches all available main game category filter options.",
 )
-def get_category_options() -> dict:
+async def get_category_options() -> dict:
     """
     Fetches available category options.
 
     Returns:
         A dictionary containing the available category options.
     """
-    return {"options": client.get_category_options()}
+    return {"options": await client.get_category_options()}
 
 
-@app.tool(
+@tool(
     title="Get Sub-Category Options",
     description="Fetches all available game sub-category filter options.",
 )
-def get_sub_category_options() -> dict:
+async def get_sub_category_options() -> dict:
     """
     Fetches available sub-category options.
 
     Returns:
         A dictionary containing the available sub-category options.
     """
-    return {"options": client.get_sub_category_options()}
+    return {"options": await client.get_sub_category_options()}
 
 
-@app.tool(
+@tool(
     title="Get Tag Options",
     description="Fetches all available game tag filter options.",
 )
-def get_tag_options() -> dict:
+async def get_tag_options() -> dict:
     """
     Fetches available tag options.
 
     Returns:
         A dictionary containing the available tag options.
     """
-    return {"options": client.get_tags()}
+    return {"options": await client.get_tags()}
 
 
-@app.tool(
+@tool(
     title="Get Android Country Options",
     description=(
         "Fetches all available country/region filter options for the Android platform."
     ),
 )
-def get_countries_android_options() -> dict:
+async def get_countries_android_options() -> dict:
     """
     Fetches available country options for Android.
 
     Returns:
         A dictionary containing the available country options for Android.
     """
-    return {"options": client.get_countries_android()}
+    return {"options": await client.get_countries_android()}
 
 
-@app.tool(
+@tool(
     title="Get iOS Country Options",
     description=(
         "Fetches all available country/region filter options for the iOS platform."
     ),
 )
-def get_countries_ios_options() -> dict:
+async def get_countries_ios_options() -> dict:
     """
     Fetches available country options for iOS.
 
     Returns:
         A dictionary containing the available country options for iOS.
     """
-    return {"options": client.get_countries_ios()}
+    return {"options": await client.get_countries_ios()}
 
 
-@app.tool(
+@tool(
     title="Get Score Options",
     description="Fetches all available score filter options.",
 )
-def get_score_options() -> dict:
+async def get_score_options() -> dict:
     """
     Fetches available score options.
 
     Returns:
         A dictionary containing the available score options.
     """
-    return {"options": client.get_score_options()}
+    return {"options": await client.get_score_options()}
 
 
-@app.tool(
+@tool(
     title="Get Home Page Content",
     description=(
         "Fetches the content for the home page, which typically includes a mix of "
         "different game lists."
     ),
 )
-def get_home(
+async def get_home(
     page: int = 1,
     platforms: list[Platform] = [Platform.ANDROID, Platform.IOS],
     ids_ignore: list[int] = [],
@@ -514,14 +601,14 @@ def get_home(
     Returns:
         A dictionary containing the home page content.
     """
-    return client.get_home(page, platforms, ids_ignore, orderBy)
+    return await client.get_home(page, platforms, ids_ignore, orderBy)
 
 
-@app.tool(
+@tool(
     title="Get Games of the Week",
     description="Fetches a list of games featured as 'Game of the Week'.",
 )
-def get_games_of_the_week(
+async def get_games_of_the_week(
     page: int = 1,
     limit: int = 50,
     platforms: list[Platform] = [Platform.ANDROID, Platform.IOS],
@@ -561,7 +648,7 @@ def get_games_of_the_week(
         information including the current page, total pages, and whether it is the
         last page.
     """
-    get_games_of_the_week_res = client.get_games_of_the_week(
+    get_games_of_the_week_res = await client.get_games_of_the_week(
         page=page,
         limit=limit,
         platforms=platforms,
@@ -578,52 +665,14 @@ def get_games_of_the_week(
         score=score,
     )
 
-    get_games_of_the_week_data = [
-        {
-            "id": get_games_of_the_week_data_item.get("id"),
-            "name": get_games_of_the_week_data_item.get("nome"),
-            "slug": get_games_of_the_week_data_item.get("slug"),
-            "score": get_games_of_the_week_data_item.get("nota"),
-            "total_reviews": get_games_of_the_week_data_item.get("avaliacoes_total"),
-            "positive_review_percentage": get_games_of_the_week_data_item.get(
-                "avaliacoes_positivas_porcento"
-            ),
-            "platform": {
-                "android": {
-                    "is_available": get_games_of_the_week_data_item.get(
-                        "disponivel_android"
-                    ),
-                },
-                "ios": {
-                    "is_available": get_games_of_the_week_data_item.get(
-                        "disponivel_ios"
-                    ),
-                },
-            },
-            "category": get_games_of_the_week_data_item.get("categoria"),
-            "categories": get_games_of_the_week_data_item.get("categorias"),
-            "description": get_games_of_the_week_data_item.get("descricao"),
-            "die_date": get_games_of_the_week_data_item.get("morto_data"),
-            "pick_date": get_games_of_the_week_data_item.get("pick_data"),
-            "week": get_games_of_the_week_data_item.get("semana"),
-            "price": get_games_of_the_week_data_item.get("price"),
-        }
-        for get_games_of_the_week_data_item in get_games_of_the_week_res.get("data")
-    ]
-
-    return {
-        "data": get_games_of_the_week_data,
-        "current_page": get_games_of_the_week_res.get("page"),
-        "total_pages": get_games_of_the_week_res.get("total"),
-        "is_last_page": get_games_of_the_week_res.get("ultima_pagina"),
-    }
+    return _format_games_list(get_games_of_the_week_res)
 
 
-@app.tool(
+@tool(
     title="Get MiniReview Picks",
     description="Fetches games that are specially selected as 'MiniReview Picks'.",
 )
-def get_minireview_pick(
+async def get_minireview_pick(
     page: int = 1,
     limit: int = 50,
     platforms: list[Platform] = [Platform.ANDROID, Platform.IOS],
@@ -661,7 +710,7 @@ def get_minireview_pick(
     Returns:
         A dictionary containing a list of MiniReview picks.
     """
-    return client.get_minireview_pick(
+    return await client.get_minireview_pick(
         page=page,
         limit=limit,
         platforms=platforms,
@@ -679,14 +728,14 @@ def get_minireview_pick(
     )
 
 
-@app.tool(
+@tool(
     title="Get Top User-Rated Games",
     description=(
         "Fetches a list of games with the top user ratings, sortable by period "
         "(e.g., this week, this month, all time)."
     ),
 )
-def get_top_user_ratings(
+async def get_top_user_ratings(
     page: int = 1,
     limit: int = 50,
     orderBy: TopUserRatingsOrderBy = TopUserRatingsOrderBy.THIS_WEEK,
@@ -704,14 +753,14 @@ def get_top_user_ratings(
     Returns:
         A dictionary containing a list of top user-rated games.
     """
-    return client.get_top_user_ratings(page, limit, orderBy, platforms)
+    return await client.get_top_user_ratings(page, limit, orderBy, platforms)
 
 
-@app.tool(
+@tool(
     title="Get Upcoming Games",
     description="Fetches a list of games that are scheduled for future release.",
 )
-def get_upcoming_games(
+async def get_upcoming_games(
     page: int = 1,
     limit: int = 50,
     orderBy: GamesListOrderBy = GamesListOrderBy.RELEASE_DATE,
@@ -729,8 +778,12 @@ def get_upcoming_games(
     Returns:
         A dictionary containing a list of upcoming games.
     """
-    return client.get_upcoming_games(page, limit, orderBy, platforms)
+    return await client.get_upcoming_games(page, limit, orderBy, platforms)
 
 
 if __name__ == "__main__":
-    app.run()
+    # uvloop, from the `speedups` extra, gives a faster event loop when installed.
+    anyio.run(
+        app.run_async,
+        backend_options={"use_uvloop": importlib.util.find_spec("uvloop") is not None},
+    )
@@ -0,0 +1,5 @@
+import os
+
+# Keep the server's filters in memory so tests never read or write the user's
+# persisted filters cache.
+os.environ["MINIREVIEW_FILTERS_CACHE"] = ""
@@ -0,0 +1,147 @@
+"""
+Unit tests for the AsyncMiniReviewClient.
+"""
+
+import asyncio
+import unittest
+
+import httpx
+
+from minireview_client.async_client import AsyncMiniReviewClient
+from minireview_client.enums import GamesListOrderBy
+
+FILTROS = [
+    {"slug": "tags", "itens": [{"slug": "2d", "nome": "2D"}]},
+    {
+        "slug": "platforms",
+        "itens": [
+            {"slug": "android", "nome": "Android"},
+            {"slug": "ios", "nome": "iOS"},
+        ],
+    },
+]
+
+
+class TestAsyncMiniReviewClient(unittest.IsolatedAsyncioTestCase):
+    """A test suite for the AsyncMiniReviewClient."""
+
+    def setUp(self):
+        """Set up a new client backed by a mock transport for each test."""
+        self.client = AsyncMiniReviewClient()
+        self.requested = []
+
+        def handler(request):
+            self.requested.append(request)
+            if dict(request.url.params) == {"limit": "1"}:
+                return httpx.Response(200, json={"filtros": FILTROS})
+            return httpx.Response(200, json={"path": request.url.path})
+
+        self.client._aclient = httpx.AsyncClient(
+            base_url=self.client.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+
+    async def asyncTearDown(self):
+        """Close the client after each test."""
+        async with self.client:
+            pass
+        self.assertIsNone(self.client._aclient)
+
+    def filters_requests(self):
+        return [r for r in self.requested if dict(r.url.params) == {"limit": "1"}]
+
+    async def test_get_filters(self):
+        """Test that the filters are fetched once and indexed."""
+        self.assertEqual(await self.client.get_filters(), FILTROS)
+        self.assertEqual(await self.client.get_tags(), {"2d": "2D"})
+        self.assertEqual(await self.client.get_players(), {})
+        (await self.client.get_tags()).clear()
+        self.assertEqual(await self.client.get_tags(), {"2d": "2D"})
+        self.assertEqual(len(self.filters_requests()), 1)
+
+    async def test_concurrent_calls(self):
+        """Test that concurrent validated calls share one filters fetch."""
+        games, home, details = await asyncio.gather(
+            self.client.get_games_list(tags=["2d"]),
+            self.client.get_home(orderBy=GamesListOrderBy.RELEASE_DATE),
+            self.client.get_game_details("my-game", "action"),
+        )
+
+        self.assertEqual(games, {"path": "/apiv2/games"})
+        self.assertEqual(home, {"path": "/apiv2/home"})
+        self.assertEqual(details, {"path": "/apiv2/games/my-game"})
+        self.assertEqual(len(self.filters_requests()), 1)
+
+    async def test_validation(self):
+        """Test that params are still validated against the filters."""
+        with self.assertRaises(ValueError):
+            await self.client.get_games_list(tags=["invalid-tag"])
+        with self.assertRaises(TypeError):
+            await self.client.get_top_user_ratings(orderBy="invalid")
+        with self.assertRaises(ValueError):
+            await self.client.get_game_details("", "action")
+
+    async def test_get_games_list_pages(self):
+        """Test that pages are fetched concurrently and returned in order."""
+        results = await self.client.get_games_list_pages([3, 1, 2], limit=5)
+
+        self.assertEqual(len(results), 3)
+        pages = [r.url.params["page"] for r in self.requested if "page" in r.url.params]
+        self.assertEqual(sorted(pages), ["1", "2", "3"])
+
+    async def test_other_endpoints(self):
+        """Test the remaining methods call their endpoints."""
+        calls = {
+            "/apiv2/games-ratings": self.client.get_game_ratings(1),
+            "/apiv2/games-similar": self.client.get_similar_games(1),
+            "/apiv2/upcoming-games": self.client.get_upcoming_games(),
+            "/apiv2/top-user-ratings": self.client.get_top_user_ratings(),
+        }
+        for path, call in calls.items():
+            self.assertEqual(await call, {"path": path})
+        self.assertEqual(
+            await self.client.get_games_of_the_week(), {"path": "/apiv2/games"}
+        )
+        self.assertEqual(
+            await self.client.get_minireview_pick(), {"path": "/apiv2/games"}
+        )
+
+    async def test_get_games_details(self):
+        """Test that the details of several games are fetched in order."""
+        details = await self.client.get_games_details(
+            [("game-a", "action"), ("game-b", "puzzle")]
+        )
+
+        self.assertEqual(
+            details, [{"path": "/apiv2/games/game-a"}, {"path": "/apiv2/games/game-b"}]
+        )
+        self.assertEqual(self.requested[1].url.params["category"], "puzzle")
+        self.assertEqual(await self.client.get_games_details([]), [])
+
+        with self.assertRaises(ValueError):
+            await self.client.get_games_details([("game-a", "action"), ("", "x")])
+
+    async def test_get_game_bundle(self):
+        """Test that the bundle gathers the three game endpoints."""
+        bundle = await self.client.get_game_bundle("my-game", "action", 1, limit=5)
+
+        self.assertEqual(
+            bundle,
+            {
+                "details": {"path": "/apiv2/games/my-game"},
+                "ratings": {"path": "/apiv2/games-ratings"},
+                "similar": {"path": "/apiv2/games-similar"},
+            },
+        )
+        ratings = next(r for r in self.requested if r.url.path.endswith("ratings"))
+        self.assertEqual(ratings.url.params["game_id"], "1")
+        self.assertEqual(ratings.url.params["limit"], "5")
+        self.assertEqual(ratings.url.params["orderBy"], "newest")
+
+    async def test_get_game_bundle_invalid_args(self):
+        """Test that the bundle rejects invalid arguments."""
+        with self.assertRaises(ValueError):
+            await self.client.get_game_bundle("", "action", 1)
+        with self.assertRaises(ValueError):
+            await self.client.get_game_bundle("my-game", "", 1)
+        with self.assertRaises(TypeError):
+            await self.client.get_game_bundle("my-game", "action", 1, platforms=["x"])
@@ -2,9 +2,18 @@
 Unit tests for the MiniReviewClient.
 """
 
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from unittest.mock import patch
 
+import httpx
 import requests
 
 from minireview_client.client import MiniReviewClient
@@ -34,6 +43,27 @@ class TestCoreClientFeatures(unittest.TestCase):
         client = MiniReviewClient()
         self.assertIsNotNone(client._session)
 
+    def test_session_adapter(self):
+        """Test that the session pools connections and retries transient errors."""
+        adapter = self.client._session.get_adapter(MiniReviewClient.BASE_URL)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertLessEqual(MiniReviewClient.PAGE_FETCH_WORKERS, adapter._pool_maxsize)
+        self.assertIs(adapter.max_retries, self.client._retry)
+        self.assertEqual(adapter.max_retries.total, MiniReviewClient.RETRIES)
+        self.assertIn(500, adapter.max_retries.status_forcelist)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertFalse(adapter.max_retries.raise_on_status)
+        self.assertEqual(
+            self.client._session.headers["User-Agent"], MiniReviewClient.USER_AGENT
+        )
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the client's context closes its session."""
+        with patch.object(self.client._session, "close") as mock_close:
+            with self.client as client:
+                self.assertIs(client, self.client)
+            mock_close.assert_called_once()
+
     @patch("minireview_client.client.MiniReviewClient._fetch_api")
     def test_get_filters_caching(self, mock_fetch_api):
         """Test that get_filters caches its response."""
@@ -53,6 +83,153 @@ class TestCoreClientFeatures(unittest.TestCase):
         self.assertEqual(mock_fetch_api.call_count, 1)  # Should not have increased
         self.assertEqual(filters2, mock_response["filtros"])
 
+    @patch("minireview_client.client.MiniReviewClient._fetch_api")
+    def test_get_filters_builds_indexes(self, mock_fetch_api):
+        """Test that get_filters indexes options and allowed values on a miss."""
+        mock_fetch_api.return_value = {
+            "filtros": [{"slug": "tags", "itens": [{"slug": "2d", "nome": "2D"}]}],
+        }
+
+        self.client.get_filters()
+
+        self.assertEqual(self.client._filter_index, {"tags": {"2d": "2D"}})
+        self.assertEqual(self.client._parsed_filters, {"tags": {"2d"}})
+        self.assertEqual(self.client.get_tags(), {"2d": "2D"})
+        self.client._init_validator()
+        mock_fetch_api.assert_called_once()
+
+    @patch("minireview_client.client.MiniReviewClient._fetch_api")
+    def test_filter_options_are_copies(self, mock_fetch_api):
+        """Test that changing returned filter options leaves the index intact."""
+        mock_fetch_api.return_value = {
+            "filtros": [{"slug": "tags", "itens": [{"slug": "2d", "nome": "2D"}]}],
+        }
+
+        self.client.get_tags()["3d"] = "3D"
+        self.client.get_players()["solo"] = "Solo"
+
+        self.assertEqual(self.client.get_tags(), {"2d": "2D"})
+        self.assertEqual(self.client.get_players(), {})
+        self.assertEqual(self.client._parsed_filters, {"tags": {"2d"}})
+
+    @patch("minireview_client.client.MiniReviewClient._fetch_api")
+    def test_get_filters_without_filtros(self, mock_fetch_api):
+        """Test that a response without filters leaves an empty validator."""
+        mock_fetch_api.return_value = {"data": []}
+
+        self.assertEqual(self.client.get_filters(), {})
+        self.assertEqual(self.client._parsed_filters, {})
+
+    @patch("minireview_client.client.time.monotonic")
+    @patch("minireview_client.client.MiniReviewClient._fetch_api")
+    def test_get_filters_caches_empty_result(self, mock_fetch_api, mock_monotonic):
+        """Test that a response without filters is only retried once it expires."""
+        mock_fetch_api.return_value = {"data": []}
+        mock_monotonic.return_value = 100.0
+
+        self.client.get_filters()
+        self.client._init_validator()
+        self.assertEqual(self.client.get_filters(), {})
+        mock_fetch_api.assert_called_once()
+
+        mock_fetch_api.return_value = {
+            "filtros": [{"slug": "tags", "itens": [{"slug": "2d", "nome": "2D"}]}],
+        }
+        mock_monotonic.return_value += MiniReviewClient.EMPTY_FILTERS_TTL
+        self.client._init_validator()
+        self.assertEqual(mock_fetch_api.call_count, 2)
+        self.assertEqual(self.client._parsed_filters, {"tags": {"2d"}})
+
+    @patch("minireview_client.client.MiniReviewClient._fetch_api")
+    def test_get_filters_persisted(self, mock_fetch_api):
+        """Test that persisted filters spare new clients the API call."""
+        filtros = [{"slug": "tags", "itens": [{"slug": "2d", "nome": "2D"}]}]
+        mock_fetch_api.return_value = {"filtros": filtros}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "cache" / "filters.json"
+
+            self.assertEqual(MiniReviewClient(path).get_filters(), filtros)
+            self.assertTrue(path.exists())
+            self.assertEqual(list(path.parent.iterdir()), [path])
+
+            client = MiniReviewClient(path)
+            self.assertEqual(client.get_filters(), filtros)
+            self.assertEqual(client._parsed_filters, {"tags": {"2d"}})
+            mock_fetch_api.assert_called_once()
+
+            # Stale filters are fetched again.
+            os.utime(path, (0, 0))
+            MiniReviewClient(path).get_filters()
+            self.assertEqual(mock_fetch_api.call_count, 2)
+
+    @patch.object(requests.Session, "get")
+    def test_clear_filters_cache(self, mock_get):
+        """Test that clearing the filters cache refetches them from the API."""
+        mock_get.return_value.content = b'{"filtros": [{"slug": "tags", "itens": []}]}'
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "filters.json"
+            client = MiniReviewClient(path)
+            client.get_filters()
+
+            client.clear_filters_cache()
+            self.assertFalse(path.exists())
+            self.assertIsNone(client._parsed_filters)
+
+            client.get_filters()
+            self.assertEqual(mock_get.call_count, 2)
+
+        # Without a cache file there is nothing to delete.
+        self.client.clear_filters_cache()
+
+    @patch("minireview_client.client.MiniReviewClient._fetch_api")
+    def test_get_filters_persisted_invalid(self, mock_fetch_api):
+        """Test that an unreadable cache file falls back to the API."""
+        mock_fetch_api.return_value = {"filtros": [{"slug": "tags", "itens": []}]}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "filters.json"
+            path.write_text("not json")
+
+            MiniReviewClient(path).get_filters()
+            mock_fetch_api.assert_called_once()
+
+            # A cache path that cannot be written to does not break the client.
+            blocked = path / "filters.json"
+            client = MiniReviewClient(blocked)
+            self.assertEqual(client.get_filters(), [{"slug": "tags", "itens": []}])
+            self.assertFalse(blocked.exists())
+
+    @patch("minireview_client.client.MiniReviewClient._fetch_api")
+    def test_get_filters_persisted_wrong_shape(self, mock_fetch_api):
+        """Test that a cache file with valid JSON of the wrong shape is replaced."""
+        filters = [{"slug": "tags", "itens": [{"slug": "2d", "nome": "2D"}]}]
+        mock_fetch_api.return_value = {"filtros": filters}
+
+        for content in ('{"a": 1}', "[1, 2]", '[{"slug": "tags"}]', '"tags"'):
+            with self.subTest(content=content), tempfile.TemporaryDirectory() as d:
+                path = Path(d) / "filters.json"
+                path.write_text(content)
+                mock_fetch_api.reset_mock()
+
+                client = MiniReviewClient(path)
+                self.assertEqual(client.get_filters(), filters)
+                mock_fetch_api.assert_called_once()
+                self.assertEqual(client.get_tags(), {"2d": "2D"})
+                self.assertEqual(json.loads(path.read_text()), filters)
+
+    @patch("minireview_client.client.os.replace", side_effect=OSError)
+    @patch("minireview_client.client.MiniReviewClient._fetch_api")
+    def test_get_filters_persist_failure(self, mock_fetch_api, mock_replace):
+        """Test that a failed write leaves no temporary file behind."""
+        mock_fetch_api.return_value = {"filtros": [{"slug": "tags", "itens": []}]}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            MiniReviewClient(Path(tmp_dir) / "filters.json").get_filters()
+            mock_replace.assert_called_once()
+            self.assertEqual(os.listdir(tmp_dir), [])
+
     @patch.object(requests.Session, "get")
     def test_fetch_api_error(self, mock_get):
         """Test that an APIError is raised on a request exception."""
@@ -61,19 +238,366 @@ class TestCoreClientFeatures(unittest.TestCase):
         with self.assertRaises(APIError):
             self.client._fetch_api("/test-endpoint")
 
+    def test_api_error_message(self):
+        """Test that an APIError can still be raised with just a message."""
+        error = APIError("Something went wrong")
+        self.assertEqual(str(error), "Something went wrong")
+        self.assertEqual(error.args, ("Something went wrong",))
+        self.assertIsNone(error.url)
+        self.assertIsNone(error.cause)
+        self.assertIsNone(error.status_code)
+
+        error = APIError(url="https://example.com", cause=ValueError("bad"))
+        self.assertEqual(
+            str(error),
+            "An error occurred while fetching data from https://example.com: bad",
+        )
+
     @patch.object(requests.Session, "get")
     def test_fetch_api_http_error(self, mock_get):
         """Test that an APIError is raised on an HTTP error."""
         mock_response = unittest.mock.Mock()
         mock_response.status_code = 404
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
-            "404 Client Error: Not Found for url: ..."
+            "404 Client Error: Not Found for url: ...", response=mock_response
         )
         mock_get.return_value = mock_response
 
         with self.assertRaises(APIError) as cm:
             self.client._fetch_api("/test-endpoint")
         self.assertIn("404 Client Error", str(cm.exception))
+        self.assertEqual(cm.exception.status_code, 404)
+        self.assertEqual(cm.exception.url, f"{MiniReviewClient.BASE_URL}/test-endpoint")
+
+    @patch.object(requests.Session, "get")
+    def test_fetch_api_decodes_content(self, mock_get):
+        """Test that the raw response body is decoded as JSON."""
+        mock_get.return_value.content = b'{"data": [1, 2]}'
+
+        self.assertEqual(self.client._fetch_api("/test-endpoint"), {"data": [1, 2]})
+
+    @patch("minireview_client.client.time.monotonic")
+    @patch.object(requests.Session, "get")
+    def test_fetch_api_response_cache(self, mock_get, mock_monotonic):
+        """Test that identical GETs are cached until they expire."""
+        mock_get.return_value.content = b'{"data": [1]}'
+        mock_monotonic.return_value = 100.0
+
+        first = self.client._fetch_api("/games", {"page": 1, "limit": 2})
+        first["data"].append(2)
+        second = self.client._fetch_api("/games", {"limit": 2, "page": 1})
+        self.assertEqual(second, {"data": [1]})
+        mock_get.assert_called_once()
+
+        self.client._fetch_api("/games", {"page": 2, "limit": 2})
+        self.assertEqual(mock_get.call_count, 2)
+
+        mock_monotonic.return_value += MiniReviewClient.RESPONSE_CACHE_TTLS["/games"]
+        self.client._fetch_api("/games", {"page": 1, "limit": 2})
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch.object(requests.Session, "get")
+    def test_clear_response_cache(self, mock_get):
+        """Test that clearing the response cache refetches from the API."""
+        mock_get.return_value.content = b'{"data": [1]}'
+
+        self.client._fetch_api("/games", {"page": 1})
+        self.client.clear_response_cache()
+        self.client._fetch_api("/games", {"page": 1})
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_response_cache_ttl(self):
+        """Test that each endpoint gets its own freshness policy."""
+        ttls = MiniReviewClient.RESPONSE_CACHE_TTLS
+        self.assertEqual(self.client._response_cache_ttl("/games"), ttls["/games"])
+        self.assertEqual(
+            self.client._response_cache_ttl("/games/my-game"), ttls["/games/"]
+        )
+        self.assertEqual(
+            self.client._response_cache_ttl("/home"),
+            MiniReviewClient.RESPONSE_CACHE_TTL,
+        )
+
+    def test_response_cache_key(self):
+        """Test that cache keys ignore param order and accept unhashable values."""
+        key = self.client._response_cache_key
+        self.assertEqual(
+            key("/games", {"page": "1", "limit": "5"}),
+            key("/games", {"limit": "5", "page": "1"}),
+        )
+        self.assertNotEqual(key("/games", {"page": "1"}), key("/home", {"page": "1"}))
+        self.assertEqual(key("/games", None), key("/games", {}))
+        self.assertEqual(
+            key("/games", {"tags": ["2d"], "score": {"min": 1}}),
+            key("/games", {"score": {"min": 1}, "tags": ["2d"]}),
+        )
+
+    @patch("minireview_client.client.time.monotonic")
+    @patch.object(requests.Session, "get")
+    def test_fetch_api_serves_stale_on_error(self, mock_get, mock_monotonic):
+        """Test that an expired response is served when the API fails."""
+        mock_get.return_value.content = b'{"data": [1]}'
+        mock_monotonic.return_value = 100.0
+        self.client._fetch_api("/home", {"tags": ["2d"]})
+
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+        mock_monotonic.return_value += MiniReviewClient.RESPONSE_CACHE_TTL
+        self.assertEqual(
+            self.client._fetch_api("/home", {"tags": ["2d"]}), {"data": [1]}
+        )
+        self.assertEqual(mock_get.call_count, 2)
+
+        # Past the stale window, the error is raised.
+        mock_monotonic.return_value += MiniReviewClient.RESPONSE_CACHE_STALE_TTL
+        with self.assertRaises(APIError):
+            self.client._fetch_api("/home", {"tags": ["2d"]})
+        self.assertEqual(self.client._response_cache, {})
+
+    @patch("urllib3.util.retry.Retry.sleep")
+    def test_fetch_api_status_errors_through_session(self, mock_sleep):
+        """Test retried and rejected statuses against a real local HTTP server."""
+        paths = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                paths.append(self.path)
+                self.send_response(int(self.path.strip("/")))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        # Send the requests through the session's own adapter and retry policy.
+        self.client.BASE_URL = f"http://127.0.0.1:{server.server_port}"
+        self.client._session.mount(
+            "http://", self.client._session.get_adapter("https://minireview.io")
+        )
+
+        for status, serves_stale in ((503, True), (429, True), (404, False)):
+            with self.subTest(status=status):
+                endpoint = f"/{status}"
+                del paths[:]
+                with self.assertRaises(APIError) as cm:
+                    self.client._fetch_api(endpoint)
+                self.assertEqual(cm.exception.status_code, status)
+                self.assertIsInstance(cm.exception.cause, requests.HTTPError)
+                retries = MiniReviewClient.RETRIES if serves_stale else 0
+                self.assertEqual(len(paths), 1 + retries)
+
+                # Only a server error may be answered with a stale response.
+                key = self.client._response_cache_key(endpoint, None)
+                self.client._response_cache[key] = (time.monotonic() - 1, b"[1]")
+                if serves_stale:
+                    self.assertEqual(self.client._fetch_api(endpoint), [1])
+                else:
+                    with self.assertRaises(APIError):
+                        self.client._fetch_api(endpoint)
+
+    @patch.object(MiniReviewClient, "RESPONSE_CACHE_MAXSIZE", 2)
+    @patch.object(requests.Session, "get")
+    def test_fetch_api_response_cache_eviction(self, mock_get):
+        """Test that the least recently used responses are evicted first."""
+        mock_get.return_value.content = b"{}"
+
+        self.client._fetch_api("/a")
+        self.client._fetch_api("/b")
+        self.client._fetch_api("/a")
+        self.client._fetch_api("/c")
+        self.assertEqual(mock_get.call_count, 3)
+
+        self.client._fetch_api("/a")
+        self.assertEqual(mock_get.call_count, 3)
+        self.client._fetch_api("/b")
+        self.assertEqual(mock_get.call_count, 4)
+
+    @patch.object(requests.Session, "get")
+    def test_fetch_api_invalid_json(self, mock_get):
+        """Test that an APIError is raised when the body is not valid JSON."""
+        mock_get.return_value.content = b"<html>"
+
+        with self.assertRaises(APIError) as cm:
+            self.client._fetch_api("/test-endpoint")
+        self.assertIsNone(cm.exception.status_code)
+        self.assertIsInstance(cm.exception.cause, ValueError)
+
+
+class TestAsyncFetch(unittest.IsolatedAsyncioTestCase):
+    """A test suite for the async, concurrent fetch helpers."""
+
+    def setUp(self):
+        """Set up a new client backed by a mock transport for each test."""
+        self.client = MiniReviewClient()
+        self.requested = []
+
+        def handler(request):
+            self.requested.append(request)
+            if request.url.path.endswith("/missing"):
+                return httpx.Response(404)
+            if request.url.path.endswith("/down"):
+                return httpx.Response(503)
+            if request.url.path.endswith("/unreachable"):
+                raise httpx.ConnectError("down", request=request)
+            return httpx.Response(200, json={"path": request.url.path})
+
+        self.client._aclient = httpx.AsyncClient(
+            base_url=self.client.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+
+    async def asyncTearDown(self):
+        """Close the async client after each test."""
+        await self.client._aclose()
+        self.assertIsNone(self.client._aclient)
+
+    async def test_afetch_api(self):
+        """Test that _afetch_api requests the endpoint with the given params."""
+        data = await self.client._afetch_api(
+            "/games", self.client._build_params({"platforms": [Platform.IOS]})
+        )
+        self.assertEqual(data, {"path": "/apiv2/games"})
+        self.assertEqual(self.requested[0].url.params["platforms[0]"], "ios")
+
+    async def test_afetch_api_http_error(self):
+        """Test that an APIError is raised on an HTTP error."""
+        with self.assertRaises(APIError) as cm:
+            await self.client._afetch_api("/missing")
+        self.assertIn("404", str(cm.exception))
+        self.assertEqual(cm.exception.status_code, 404)
+
+    async def use_responses(self, responses: list[httpx.Response]):
+        """Answers the next requests with `responses`, in order."""
+        await self.client._aclient.aclose()
+        self.client._aclient = httpx.AsyncClient(
+            base_url=self.client.BASE_URL,
+            transport=httpx.MockTransport(lambda request: responses.pop(0)),
+        )
+
+    @patch("minireview_client.client.asyncio.sleep")
+    async def test_afetch_api_retries_server_errors(self, mock_sleep):
+        """Test that the async path retries like the session does."""
+        responses = [
+            httpx.Response(503),
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"ok": 1}),
+        ]
+        await self.use_responses(responses)
+
+        self.assertEqual(await self.client._afetch_api("/games"), {"ok": 1})
+        self.assertEqual(responses, [])
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0, 2])
+
+    @patch("minireview_client.client.asyncio.sleep")
+    async def test_afetch_api_gives_up_after_retries(self, mock_sleep):
+        """Test that the last failure is raised once the retries run out."""
+        responses = [httpx.Response(502)] * (MiniReviewClient.RETRIES + 2)
+        await self.use_responses(responses)
+
+        with self.assertRaises(APIError) as cm:
+            await self.client._afetch_api("/games")
+        self.assertEqual(cm.exception.status_code, 502)
+        self.assertEqual(len(responses), 1)
+        self.assertEqual(mock_sleep.call_count, MiniReviewClient.RETRIES)
+
+    async def test_agather(self):
+        """Test that _agather returns the responses in request order."""
+        calls = [("/games", {"limit": 1}), ("/games/a", None), ("/games/b", None)]
+        results = await self.client._agather(
+            self.client._afetch_api(endpoint, params) for endpoint, params in calls
+        )
+        self.assertEqual(
+            [r["path"] for r in results],
+            ["/apiv2/games", "/apiv2/games/a", "/apiv2/games/b"],
+        )
+        self.assertEqual(len(self.requested), 3)
+
+        # Repeated requests are answered from the response cache.
+        await self.client._agather([self.client._afetch_api("/games", {"limit": 1})])
+        self.assertEqual(len(self.requested), 3)
+
+    @patch("minireview_client.client.asyncio.sleep")
+    async def test_afetch_api_serves_stale_on_error(self, mock_sleep):
+        """Test that an expired response is served when the API fails."""
+        for endpoint in ("/down", "/unreachable"):
+            with self.assertRaises(APIError):
+                await self.client._afetch_api(endpoint)
+
+            key = self.client._response_cache_key(endpoint, None)
+            self.client._response_cache[key] = (time.monotonic() - 1, b'{"stale": 1}')
+            self.assertEqual(await self.client._afetch_api(endpoint), {"stale": 1})
+
+    async def test_afetch_api_raises_client_errors_over_stale(self):
+        """Test that a rejected request is not answered with a stale response."""
+        key = self.client._response_cache_key("/missing", None)
+        self.client._response_cache[key] = (time.monotonic() - 1, b'{"stale": 1}')
+
+        with self.assertRaises(APIError) as cm:
+            await self.client._afetch_api("/missing")
+        self.assertEqual(cm.exception.status_code, 404)
+
+    async def test_afetch_api_coalesces_identical_requests(self):
+        """Test that concurrent identical requests share one API call."""
+        first, second, other = await asyncio.gather(
+            self.client._afetch_api("/games", {"page": "1"}),
+            self.client._afetch_api("/games", {"page": "1"}),
+            self.client._afetch_api("/games", {"page": "2"}),
+        )
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(self.requested), 2)
+        self.assertEqual(self.client._inflight, {})
+
+        results = await asyncio.gather(
+            self.client._afetch_api("/missing"),
+            self.client._afetch_api("/missing"),
+            return_exceptions=True,
+        )
+        self.assertTrue(all(isinstance(r, APIError) for r in results))
+        self.assertEqual(len(self.requested), 3)
+
+    async def test_agather_limits_concurrency(self):
+        """Test that _agather keeps at most MAX_CONCURRENT_REQUESTS in flight."""
+        active = peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json={"page": request.url.params["page"]})
+
+        await self.client._aclient.aclose()
+        self.client._aclient = httpx.AsyncClient(
+            base_url=self.client.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        self.client.MAX_CONCURRENT_REQUESTS = 2
+
+        results = await self.client._agather(
+            self.client._afetch_api("/games", {"page": str(page)}) for page in range(5)
+        )
+
+        self.assertEqual([r["page"] for r in results], ["0", "1", "2", "3", "4"])
+        self.assertEqual(peak, 2)
+
+    async def test_get_aclient_is_created_lazily(self):
+        """Test that the pooled async client is only created on first use."""
+        client = MiniReviewClient()
+        self.assertIsNone(client._aclient)
+        aclient = client._get_aclient()
+        self.assertIs(client._get_aclient(), aclient)
+        self.assertEqual(aclient.headers["User-Agent"], client.USER_AGENT)
+        self.assertEqual(
+            aclient._transport._pool._keepalive_expiry, client.KEEPALIVE_EXPIRY
+        )
+        self.assertEqual(aclient._transport._pool._retries, client.RETRIES)
+        await client._aclose()
 
 
 @patch("minireview_client.client.MiniReviewClient._fetch_api")
@@ -103,6 +627,18 @@ class TestApiClientCalls(unittest.TestCase):
         self.assertEqual(call_args[1]["getBy"], "slug")
         self.assertEqual(call_args[1]["category"], category)
 
+    def test_get_games_list_pages_call(self, mock_init_validator, mock_fetch_api):
+        """Test that get_games_list_pages fetches every page with the filters."""
+        mock_fetch_api.side_effect = lambda endpoint, params: {"page": params["page"]}
+
+        results = self.client.get_games_list_pages(range(1, 11), tags=["2d"])
+
+        self.assertEqual(results, [{"page": page} for page in range(1, 11)])
+        self.assertEqual(mock_fetch_api.call_count, 10)
+        for call in mock_fetch_api.call_args_list:
+            self.assertEqual(call[0][0], "/games")
+            self.assertEqual(call[0][1]["tags"], "2d")
+
     def test_get_game_ratings_call(self, mock_init_validator, mock_fetch_api):
         """Test that get_game_ratings calls _fetch_api with correct params."""
         self.client.get_game_ratings(
@@ -242,6 +778,32 @@ class TestParameterValidation(unittest.TestCase):
             self.client.get_games_list(score="invalid_score")
         self.assertIn("Score parameter must be a dictionary", str(cm.exception))
 
+    def test_validation_is_memoized(self, mock_init, mock_fetch):
+        """Test that identical filter params are only validated once."""
+        with patch.object(
+            self.client,
+            "_validate_filter_param",
+            wraps=self.client._validate_filter_param,
+        ) as mock_validate:
+            self.client.get_games_list(page=1, category=["action"])
+            validations = mock_validate.call_count
+            self.client.get_games_list(page=2, category=["action"])
+            self.assertEqual(mock_validate.call_count, validations)
+
+            self.client.get_games_list(page=2, category=["adventure"])
+            self.assertGreater(mock_validate.call_count, validations)
+
+        # Invalid params are never memoized.
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.client.get_games_list(category=["invalid-category"])
+
+    def test_validation_memo_keeps_value_types(self, mock_init, mock_fetch):
+        """Test that a memoized value does not let an equal one of another type pass."""
+        self.client.get_games_list(score={"gameplay": 1})
+        with self.assertRaises(ValueError):
+            self.client.get_games_list(score={"gameplay": 1.0})
+
     def test_get_games_list_validation_success(self, mock_init, mock_fetch):
         """Test get_games_list validation with valid parameters."""
         try:
@@ -256,6 +818,33 @@ class TestParameterValidation(unittest.TestCase):
         except (ValueError, TypeError):
             self.fail("get_games_list raised an exception unexpectedly!")
 
+    def test_get_games_list_defaults(self, mock_init, mock_fetch):
+        """Test that get_games_list only sends the non-empty default params."""
+        self.client.get_games_list()
+        self.assertEqual(
+            mock_fetch.call_args[0][1],
+            {
+                "page": 1,
+                "limit": 50,
+                "orderBy": "last-added-reviews",
+                "platforms[0]": "android",
+                "platforms[1]": "ios",
+            },
+        )
+
+    def test_enum_values_as_strings(self, mock_init, mock_fetch):
+        """Test that enum params also accept their string values."""
+        self.client.get_games_list(orderBy="release-date", platforms=["ios"])
+        params = mock_fetch.call_args[0][1]
+        self.assertEqual(params["orderBy"], "release-date")
+        self.assertEqual(params["platforms[0]"], "ios")
+
+        self.client.get_similar_games(game_id=1, players="singleplayer")
+        self.assertEqual(mock_fetch.call_args[0][1]["players"], "singleplayer")
+
+        with self.assertRaises(TypeError):
+            self.client.get_games_list(platforms=[["android"]])
+
     def test_get_games_list_validation_failure(self, mock_init, mock_fetch):
         """Test get_games_list validation with invalid parameters."""
         with self.assertRaises(TypeError):
@@ -335,69 +924,34 @@ class TestParameterValidation(unittest.TestCase):
         except (ValueError, TypeError):
             self.fail("get_home raised an exception unexpectedly!")
 
-    def test_get_games_of_the_week_validation(self, mock_init, mock_fetch):
-        """Test get_games_of_the_week validation."""
-        with self.assertRaises(TypeError):
-            self.client.get_games_of_the_week(platforms=["invalid-platform"])
-        with self.assertRaises(ValueError):
-            self.client.get_games_of_the_week(category=["invalid-category"])
-        with self.assertRaises(ValueError):
-            self.client.get_games_of_the_week(players=["invalid-player"])
-        with self.assertRaises(ValueError):
-            self.client.get_games_of_the_week(network=["invalid-network"])
-        with self.assertRaises(ValueError):
-            self.client.get_games_of_the_week(
-                monetization_android=["invalid-monetization"]
-            )
-        with self.assertRaises(ValueError):
-            self.client.get_games_of_the_week(monetization_ios=["invalid-monetization"])
-        with self.assertRaises(ValueError):
-            self.client.get_games_of_the_week(
-                screen_orientation=["invalid-orientation"]
-            )
-        with self.assertRaises(ValueError):
-            self.client.get_games_of_the_week(sub_category=["invalid-sub-category"])
-        with self.assertRaises(ValueError):
-            self.client.get_games_of_the_week(tags=["invalid-tag"])
-        with self.assertRaises(ValueError):
-            self.client.get_games_of_the_week(countries_android=["invalid-country"])
-        with self.assertRaises(ValueError):
-            self.client.get_games_of_the_week(countries_ios=["invalid-country"])
-        try:
-            self.client.get_games_of_the_week(platforms=[Platform.IOS])
-        except (ValueError, TypeError):
-            self.fail("get_games_of_the_week raised an exception unexpectedly!")
-
-    def test_get_minireview_pick_validation(self, mock_init, mock_fetch):
-        """Test get_minireview_pick validation."""
-        with self.assertRaises(TypeError):
-            self.client.get_minireview_pick(platforms=["invalid-platform"])
-        with self.assertRaises(ValueError):
-            self.client.get_minireview_pick(category=["invalid-category"])
-        with self.assertRaises(ValueError):
-            self.client.get_minireview_pick(players=["invalid-player"])
-        with self.assertRaises(ValueError):
-            self.client.get_minireview_pick(network=["invalid-network"])
-        with self.assertRaises(ValueError):
-            self.client.get_minireview_pick(
-                monetization_android=["invalid-monetization"]
-            )
-        with self.assertRaises(ValueError):
-            self.client.get_minireview_pick(monetization_ios=["invalid-monetization"])
-        with self.assertRaises(ValueError):
-            self.client.get_minireview_pick(screen_orientation=["invalid-orientation"])
-        with self.assertRaises(ValueError):
-            self.client.get_minireview_pick(sub_category=["invalid-sub-category"])
-        with self.assertRaises(ValueError):
-            self.client.get_minireview_pick(tags=["invalid-tag"])
-        with self.assertRaises(ValueError):
-            self.client.get_minireview_pick(countries_android=["invalid-country"])
-        with self.assertRaises(ValueError):
-            self.client.get_minireview_pick(countries_ios=["invalid-country"])
-        try:
-            self.client.get_minireview_pick(platforms=[Platform.IOS])
-        except (ValueError, TypeError):
-            self.fail("get_minireview_pick raised an exception unexpectedly!")
+    def test_featured_games_validation(self, mock_init, mock_fetch):
+        """Test get_games_of_the_week and get_minireview_pick validation."""
+        invalid_filters = {
+            "category": ["invalid-category"],
+            "players": ["invalid-player"],
+            "network": ["invalid-network"],
+            "monetization_android": ["invalid-monetization"],
+            "monetization_ios": ["invalid-monetization"],
+            "screen_orientation": ["invalid-orientation"],
+            "sub_category": ["invalid-sub-category"],
+            "tags": ["invalid-tag"],
+            "countries_android": ["invalid-country"],
+            "countries_ios": ["invalid-country"],
+        }
+        for method in (
+            self.client.get_games_of_the_week,
+            self.client.get_minireview_pick,
+        ):
+            with self.subTest(method=method.__name__):
+                with self.assertRaises(TypeError):
+                    method(platforms=["invalid-platform"])
+                for name, value in invalid_filters.items():
+                    with self.assertRaises(ValueError, msg=name):
+                        method(**{name: value})
+                try:
+                    method(platforms=[Platform.IOS])
+                except (ValueError, TypeError):
+                    self.fail(f"{method.__name__} raised an exception unexpectedly!")
 
     def test_get_top_user_ratings_validation(self, mock_init, mock_fetch):
         """Test get_top_user_ratings validation."""
@@ -457,9 +1011,12 @@ class TestBuildParams(unittest.TestCase):
             "c": [],
             "d": {},
             "e": "value",
+            "tags": (),
+            "platforms": (),
+            "f": 0,
         }
         processed_params = self.client._build_params(params)
-        self.assertEqual(processed_params, {"e": "value"})
+        self.assertEqual(processed_params, {"e": "value", "f": 0})
 
     def test_list_of_strings(self):
         """Test a list of strings."""
@@ -467,6 +1024,24 @@ class TestBuildParams(unittest.TestCase):
         processed_params = self.client._build_params(params)
         self.assertEqual(processed_params, {"tags": "2d,3d"})
 
+    @patch.object(requests.Session, "get")
+    def test_single_string_for_list_filter(self, mock_get):
+        """Test that a single string for a list filter is sent unsplit."""
+        mock_get.return_value.content = b"{}"
+        self.client._parsed_filters = {"category": {"action"}, "tags": {"2d"}}
+
+        self.client.get_games_list(category="action", tags="2d")
+
+        url, kwargs = mock_get.call_args[0][0], mock_get.call_args[1]
+        sent = requests.Request("GET", url, params=kwargs["params"]).prepare().url
+        self.assertEqual(
+            sent,
+            f"{self.client.BASE_URL}/games?page=1&limit=50"
+            "&orderBy=last-added-reviews"
+            "&platforms%5B0%5D=android&platforms%5B1%5D=ios"
+            "&category=action&tags=2d",
+        )
+
     def test_list_of_enums(self):
         """Test a list of enums."""
         params = {"platforms": [Platform.ANDROID, Platform.IOS]}
@@ -475,12 +1050,72 @@ class TestBuildParams(unittest.TestCase):
             processed_params, {"platforms[0]": "android", "platforms[1]": "ios"}
         )
 
+    def test_enums_are_strings(self):
+        """Test that enum members can be used directly as their string values."""
+        self.assertIsInstance(Platform.ANDROID, str)
+        self.assertEqual(Platform.ANDROID, "android")
+        self.assertEqual(str(GamesListOrderBy.RELEASE_DATE), "release-date")
+        self.assertEqual(f"{Monetization.FREE}", "free")
+
+    def test_comma_separated_enums(self):
+        """Test that enums in comma-separated lists use their values."""
+        params = {"monetization_android": [Monetization.FREE, Monetization.PAID]}
+        processed_params = self.client._build_params(params)
+        self.assertEqual(processed_params, {"monetization_android": "free,paid"})
+
+    def test_unregistered_enum(self):
+        """Test that enums outside the client's enums still use their values."""
+        from enum import Enum
+
+        class Custom(Enum):
+            VALUE = "custom"
+
+        processed_params = self.client._build_params(
+            {"a": Custom.VALUE, "b": [Custom.VALUE]}
+        )
+        self.assertEqual(processed_params, {"a": "custom", "b": "custom"})
+
+    def test_default_platforms(self):
+        """Test that the shared default platforms tuple is encoded like a list."""
+        from minireview_client.client import _DEFAULT_PLATFORMS
+
+        processed_params = self.client._build_params({"platforms": _DEFAULT_PLATFORMS})
+        self.assertEqual(
+            processed_params, {"platforms[0]": "android", "platforms[1]": "ios"}
+        )
+        self.assertEqual(
+            processed_params,
+            self.client._build_params({"platforms": [Platform.ANDROID, Platform.IOS]}),
+        )
+
+    def test_subclassed_values(self):
+        """Test that subclasses of lists and dicts are encoded like their bases."""
+        from collections import OrderedDict, UserString
+
+        params = {
+            "tags": ["2d"],
+            "a": type("TagList", (list,), {})(["2d", "3d"]),
+            "b": OrderedDict(x=1),
+            "c": UserString("text"),
+        }
+        processed_params = self.client._build_params(params)
+        self.assertEqual(
+            processed_params,
+            {"tags": "2d", "a": "2d,3d", "b[x]": 1, "c": UserString("text")},
+        )
+
     def test_score_dict(self):
         """Test the score dictionary."""
         params = {"score": {"min": 80, "max": 100}}
         processed_params = self.client._build_params(params)
         self.assertEqual(processed_params, {"score": "min-80,max-100"})
 
+    def test_other_dict(self):
+        """Test that dictionaries other than score use indexed keys."""
+        params = {"extra": {"a": 1, "b": 2}}
+        processed_params = self.client._build_params(params)
+        self.assertEqual(processed_params, {"extra[a]": 1, "extra[b]": 2})
+
     def test_boolean_values(self):
         """Test boolean to integer conversion."""
         params = {"is_new": True, "is_updated": False}
@@ -579,40 +1214,42 @@ class TestBuildParams(unittest.TestCase):
 class TestFilterMethods(unittest.TestCase):
     """A test suite for the filter helper methods."""
 
+    # Only read by the client, so one copy serves every test.
+    MOCK_FILTERS_RESPONSE = [
+        {
+            "slug": "players",
+            "itens": [
+                {"slug": "singleplayer", "nome": "Singleplayer"},
+                {"slug": "multiplayer", "nome": "Multiplayer"},
+            ],
+        },
+        {
+            "slug": "countries-android",
+            "itens": [
+                {"slug": "us", "nome": "United States"},
+                {"slug": "br", "nome": "Brazil"},
+            ],
+        },
+        {"slug": "network", "itens": [{"slug": "online", "nome": "Online"}]},
+        {
+            "slug": "monetization-android",
+            "itens": [{"slug": "free", "nome": "Free"}],
+        },
+        {"slug": "monetization-ios", "itens": [{"slug": "paid", "nome": "Paid"}]},
+        {
+            "slug": "screen-orientation",
+            "itens": [{"slug": "portrait", "nome": "Portrait"}],
+        },
+        {"slug": "category", "itens": [{"slug": "action", "nome": "Action"}]},
+        {"slug": "sub-category", "itens": [{"slug": "rpg", "nome": "RPG"}]},
+        {"slug": "score", "itens": [{"slug": "gameplay", "nome": "Gameplay"}]},
+    ]
+
     def setUp(self):
         """Set up a new client and mock get_filters for each test."""
         self.client = MiniReviewClient()
-        self.mock_filters_response = [
-            {
-                "slug": "players",
-                "itens": [
-                    {"slug": "singleplayer", "nome": "Singleplayer"},
-                    {"slug": "multiplayer", "nome": "Multiplayer"},
-                ],
-            },
-            {
-                "slug": "countries-android",
-                "itens": [
-                    {"slug": "us", "nome": "United States"},
-                    {"slug": "br", "nome": "Brazil"},
-                ],
-            },
-            {"slug": "network", "itens": [{"slug": "online", "nome": "Online"}]},
-            {
-                "slug": "monetization-android",
-                "itens": [{"slug": "free", "nome": "Free"}],
-            },
-            {"slug": "monetization-ios", "itens": [{"slug": "paid", "nome": "Paid"}]},
-            {
-                "slug": "screen-orientation",
-                "itens": [{"slug": "portrait", "nome": "Portrait"}],
-            },
-            {"slug": "category", "itens": [{"slug": "action", "nome": "Action"}]},
-            {"slug": "sub-category", "itens": [{"slug": "rpg", "nome": "RPG"}]},
-            {"slug": "score", "itens": [{"slug": "gameplay", "nome": "Gameplay"}]},
-        ]
         self.client.get_filters = unittest.mock.Mock(
-            return_value=self.mock_filters_response
+            return_value=self.MOCK_FILTERS_RESPONSE
         )
 
     def test_get_filter_options(self, mock_fetch_api):
@@ -650,6 +1287,21 @@ class TestFilterMethods(unittest.TestCase):
         non_existent = self.client._get_filter_options("non-existent-filter")
         self.assertEqual(non_existent, {})
 
+    def test_filter_options_are_indexed_once(self, mock_fetch_api):
+        """Test that the filters are parsed once for options and validation."""
+        with patch.object(
+            self.client, "_index_filters", wraps=self.client._index_filters
+        ) as mock_index_filters:
+            self.client.get_players()
+            self.client.get_category_options()
+            self.client.get_score_options()
+            self.client._init_validator()
+
+        mock_index_filters.assert_called_once()
+        self.assertEqual(
+            self.client._parsed_filters["players"], {"singleplayer", "multiplayer"}
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
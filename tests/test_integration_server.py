@@ -1,12 +1,16 @@
 import json
+from pathlib import Path
 
 import pytest
 from fastmcp import Client, FastMCP
 
+from server import app as server_app
+from server import client as server_client
 from server import (
     get_category_options,
     get_countries_android_options,
     get_countries_ios_options,
+    get_game_bundle,
     get_game_details,
     get_game_ratings,
     get_games_list,
@@ -184,6 +188,44 @@ async def test_get_similar_games_integration():
         assert "is_last_page" in similar_games_data
 
 
+@pytest.mark.asyncio
+# The bundle makes the same requests as the single tools, so it is played back
+# from their recordings of the same game.
+@pytest.mark.vcr(
+    "test_get_game_details_integration.yaml",
+    "test_get_game_ratings_integration.yaml",
+    "test_get_similar_games_integration.yaml",
+)
+async def test_get_game_bundle_integration():
+    app = FastMCP()
+    app.tool(get_games_list.fn)
+    app.tool(get_game_details.fn)
+    app.tool(get_game_bundle.fn)
+
+    async with Client(app) as client:
+        list_result = await client.call_tool("get_games_list", {"limit": 1})
+        list_data = json.loads(list_result.content[0].text)
+        game = list_data["data"][0]
+
+        bundle_result = await client.call_tool(
+            "get_game_bundle",
+            {
+                "game_slug": game["slug"],
+                "category": game["category"]["slug"],
+                "game_id": game["id"],
+                "limit": 1,
+            },
+        )
+        bundle_data = json.loads(bundle_result.content[0].text)
+
+        assert bundle_data["details"]["id"] == game["id"]
+        assert bundle_data["details"]["slug"] == game["slug"]
+        assert isinstance(bundle_data["ratings"]["data"], list)
+        assert "total_ratings" in bundle_data["ratings"]
+        assert len(bundle_data["similar_games"]["data"]) > 0
+        assert "total_games" in bundle_data["similar_games"]
+
+
 @pytest.mark.asyncio
 @pytest.mark.vcr()
 async def test_get_home_integration():
@@ -385,3 +427,32 @@ async def test_get_score_options_integration():
         data = json.loads(result.content[0].text)
         assert isinstance(data, dict)
         assert "options" in data
+
+
+@pytest.mark.asyncio
+async def test_tools_manifest_is_up_to_date():
+    """The agent's tools manifest must match the tools the server registers."""
+    manifest_path = (
+        Path(__file__).parent.parent / "minireview_agent" / "tools_manifest.json"
+    )
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    async with Client(server_app) as client:
+        tools = await client.list_tools()
+
+    assert manifest == sorted(
+        (t.model_dump(mode="json", by_alias=True, exclude_none=True) for t in tools),
+        key=lambda t: t["name"],
+    ), "Regenerate it with `python -m minireview_agent.toolset`."
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_async_pool():
+    """The server closes the client's async connection pool when it shuts down."""
+    server_client._get_aclient()
+
+    async with Client(server_app) as client:
+        await client.ping()
+
+    assert server_client._aclient is None
@@ -0,0 +1,76 @@
+"""
+Unit tests for the LazyMcpToolset.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
+
+from minireview_agent.toolset import SERVER_PARAMS, LazyMcpToolset
+
+MANIFEST = [
+    {"name": name, "inputSchema": {"type": "object", "properties": {}}}
+    for name in ("get_home", "transfer_to_agent", "get_games_list", "get_tags")
+]
+
+
+class TestLazyMcpToolset(unittest.IsolatedAsyncioTestCase):
+    """A test suite for building the agent's tools from the manifest."""
+
+    def setUp(self):
+        """Write the manifest to a temporary file for each test."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.manifest_path = Path(tmp_dir.name) / "tools_manifest.json"
+        self.manifest_path.write_text(json.dumps(MANIFEST))
+
+    def make_toolset(self, **kwargs) -> LazyMcpToolset:
+        return LazyMcpToolset(
+            connection_params=StdioConnectionParams(server_params=SERVER_PARAMS),
+            manifest_path=self.manifest_path,
+            **kwargs,
+        )
+
+    async def test_get_tools_from_manifest(self):
+        """Test that the tools are built like McpToolset does, without the server."""
+
+        def header_provider(context):
+            return {}
+
+        toolset = self.make_toolset(
+            tool_filter=["get_home", "get_games_list", "transfer_to_agent"],
+            require_confirmation=True,
+            header_provider=header_provider,
+        )
+        with patch.object(
+            toolset._mcp_session_manager, "create_session"
+        ) as mock_create_session:
+            tools = await toolset.get_tools()
+
+        mock_create_session.assert_not_called()
+        # Filtered, without the reserved ADK name, and sorted.
+        self.assertEqual([t.name for t in tools], ["get_games_list", "get_home"])
+        for tool in tools:
+            self.assertTrue(tool._require_confirmation)
+            self.assertIs(tool._header_provider, header_provider)
+            self.assertIs(tool._mcp_session_manager, toolset._mcp_session_manager)
+
+    async def test_get_tools_without_manifest(self):
+        """Test that the tools are listed from the server if there is no manifest."""
+        self.manifest_path.unlink()
+        toolset = self.make_toolset()
+
+        with patch.object(
+            toolset, "_execute_with_session", side_effect=RuntimeError("no server")
+        ) as mock_execute:
+            with self.assertRaises(RuntimeError):
+                await toolset.get_tools()
+        mock_execute.assert_called()
+
+
+if __name__ == "__main__":
+    unittest.main()